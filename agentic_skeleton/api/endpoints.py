@@ -13,9 +13,62 @@ from agentic_skeleton.config import settings
 from agentic_skeleton.core.mock_core import generate_mock_plan_and_results
 from agentic_skeleton.core.azure_core import generate_azure_plan_and_results
 
+# Optional: serialize responses with orjson when it is installed (Flask 2.2+ JSON providers)
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
+
 # Create Flask application
 app = Flask(__name__)
 
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson, keeping Flask's sort_keys, ensure_ascii and default handling"""
+        
+        def dumps(self, obj, **kwargs):
+            # jsonify passes the compact separators or indent=2; other options go through the default encoder
+            if (set(kwargs) <= {"indent", "separators"} and kwargs.get("indent") in (None, 2)
+                    and kwargs.get("separators") in (None, (",", ":"))):
+                option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+                if self.sort_keys:
+                    option |= orjson.OPT_SORT_KEYS
+                if kwargs.get("indent"):
+                    option |= orjson.OPT_INDENT_2
+                try:
+                    data = orjson.dumps(obj, default=self.default, option=option)
+                except TypeError:
+                    data = None
+                # orjson always writes raw UTF-8, so escaped non-ASCII output stays with the default encoder
+                if data is not None and (data.isascii() or not self.ensure_ascii):
+                    return data.decode()
+            return super().dumps(obj, **kwargs)
+            
+        def loads(self, s, **kwargs):
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return orjson.loads(s)
+    
+    app.json = OrjsonProvider(app)
+
+# Maximum number of requests accepted by a single /run-agent-batch call
+MAX_BATCH_REQUESTS = 20
+
+def process_request(user_req: str):
+    """
+    Generate the plan and results for a single user request in the active mode.
+    
+    Args:
+        user_req: The user's request text
+        
+    Returns:
+        Tuple containing (subtasks, results)
+    """
+    if settings.is_using_mock():
+        return generate_mock_plan_and_results(user_req)
+    return generate_azure_plan_and_results(user_req)
+
 @app.route("/health", methods=["GET"])
 def health_check() -> Response:
     """
@@ -29,7 +82,7 @@ def health_check() -> Response:
         "mode": "mock" if settings.is_using_mock() else "azure",
         "version": "1.0.0"
     }
-    logging.info(f"Health check: {status}")
+    logging.info("Health check: %s", status)
     return jsonify(status)
 
 @app.route("/run-agent", methods=["POST"])
@@ -51,13 +104,13 @@ def run_agent() -> Response:
                     "message": "The request contains invalid JSON"
                 }), 400
         except Exception as e:
-            logging.warning(f"Error parsing JSON: {str(e)}")
+            logging.warning("Error parsing JSON: %s", e)
             return jsonify({
                 "error": "Malformed JSON",
                 "message": str(e)
             }), 400
             
-        if not payload or 'request' not in payload:
+        if not isinstance(payload, dict) or 'request' not in payload:
             error_msg = "Missing 'request' field in payload"
             logging.warning(error_msg)
             return jsonify({
@@ -66,17 +119,21 @@ def run_agent() -> Response:
             }), 400
             
         user_req = payload["request"]
+        if not isinstance(user_req, str):
+            error_msg = "Invalid 'request' field in payload"
+            logging.warning(error_msg)
+            return jsonify({
+                "error": error_msg,
+                "message": "The 'request' field must be a string"
+            }), 400
         req_summary = user_req[:50] + ('...' if len(user_req) > 50 else '')
-        logging.info(f"Processing request: '{req_summary}'")
+        logging.info("Processing request: '%s'", req_summary)
         
         # Process the request
-        if settings.is_using_mock():
-            subtasks, results = generate_mock_plan_and_results(user_req)
-        else:
-            subtasks, results = generate_azure_plan_and_results(user_req)
+        subtasks, results = process_request(user_req)
             
         # Return the plan and results
-        logging.info(f"Successfully processed request with {len(subtasks)} subtasks")
+        logging.info("Successfully processed request with %d subtasks", len(subtasks))
         return jsonify({
             "plan": subtasks,
             "results": results
@@ -88,4 +145,60 @@ def run_agent() -> Response:
         return jsonify({
             "error": error_msg,
             "message": "An unexpected error occurred while processing the request"
+        }), 500
+
+@app.route("/run-agent-batch", methods=["POST"])
+def run_agent_batch() -> Response:
+    """
+    Process several user requests in one call, saving a round trip per request.
+    
+    Returns:
+        JSON response with one plan/results entry per request, in request order
+    """
+    try:
+        payload = request.get_json(silent=True)
+        if payload is None:
+            logging.warning("Malformed JSON in batch request")
+            return jsonify({
+                "error": "Malformed JSON",
+                "message": "The request contains invalid JSON"
+            }), 400
+            
+        user_reqs = payload.get("requests") if isinstance(payload, dict) else None
+        if not isinstance(user_reqs, list) or not all(isinstance(r, str) for r in user_reqs):
+            error_msg = "Missing or invalid 'requests' field in payload"
+            logging.warning(error_msg)
+            return jsonify({
+                "error": error_msg,
+                "message": "Please provide a 'requests' list of strings in your JSON payload"
+            }), 400
+            
+        if len(user_reqs) > MAX_BATCH_REQUESTS:
+            error_msg = f"Too many requests in batch (maximum {MAX_BATCH_REQUESTS})"
+            logging.warning(error_msg)
+            return jsonify({
+                "error": error_msg,
+                "message": "Split the requests into smaller batches"
+            }), 400
+            
+        logging.info("Processing batch of %d requests", len(user_reqs))
+        
+        # Process each request; a failure only affects its own entry
+        responses = []
+        for user_req in user_reqs:
+            try:
+                subtasks, results = process_request(user_req)
+                responses.append({"plan": subtasks, "results": results})
+            except Exception as e:
+                logging.error("Error processing batch entry: %s", e)
+                responses.append({"error": f"Unexpected error: {str(e)}"})
+                
+        return jsonify({"responses": responses})
+        
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        logging.error(error_msg)
+        return jsonify({
+            "error": error_msg,
+            "message": "An unexpected error occurred while processing the batch"
         }), 500
\ No newline at end of file
@@ -28,6 +28,25 @@ MODEL_EXECUTOR = os.getenv("MODEL_EXECUTOR", "gpt-4").lower()
 # Server configuration
 PORT = int(os.getenv("PORT", "8000"))
 
+# Maximum number of subtasks executed concurrently against Azure OpenAI
+MAX_CONCURRENT_SUBTASKS = int(os.getenv("MAX_CONCURRENT_SUBTASKS", "10"))
+
+# Stream the plan and start each subtask as soon as its line arrives
+STREAM_PLAN_EXECUTION = os.getenv("STREAM_PLAN_EXECUTION", "false").lower() == "true"
+
+# Subtasks answered per Azure OpenAI call; 1 sends every subtask on its own, 0 sends the whole plan at once
+SUBTASK_GROUP_SIZE = int(os.getenv("SUBTASK_GROUP_SIZE", "1"))
+
+# Response caching (reuses completions for identical prompts)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+
+# Semantic caching (reuses plans and results for requests differing only in case, punctuation or whitespace)
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_TTL = int(os.getenv("SEMANTIC_CACHE_TTL", "3600"))  # seconds; 0 keeps entries until evicted
+
+# Longest wait for an Azure OpenAI batch job before it is cancelled
+BATCH_MAX_WAIT = int(os.getenv("BATCH_MAX_WAIT", "3600"))  # seconds
+
 
 
 
@@ -98,6 +117,14 @@ EXECUTOR_TEMPLATE = (
     "Result:"
 )
 
+# Wraps several executor prompts in one call when SUBTASK_GROUP_SIZE > 1
+GROUPED_EXECUTOR_TEMPLATE = (
+    "You will receive {count} separate tasks, each with its own instructions.\n"
+    "Answer every task in order. End each answer with a line containing only {delimiter}\n"
+    "and do not use that marker anywhere else.\n\n"
+    "{tasks}"
+)
+
 
 
 
@@ -119,8 +146,16 @@ def get_config() -> Dict[str, Any]:
         "model_executor": MODEL_EXECUTOR,
         "azure_domain_knowledge": AZURE_DOMAIN_KNOWLEDGE,
         "port": PORT,
+        "max_concurrent_subtasks": MAX_CONCURRENT_SUBTASKS,
+        "stream_plan_execution": STREAM_PLAN_EXECUTION,
+        "subtask_group_size": SUBTASK_GROUP_SIZE,
+        "llm_cache_enabled": LLM_CACHE_ENABLED,
+        "semantic_cache_enabled": SEMANTIC_CACHE_ENABLED,
+        "semantic_cache_ttl": SEMANTIC_CACHE_TTL,
+        "batch_max_wait": BATCH_MAX_WAIT,
         "planner_template": PLANNER_TEMPLATE,
-        "executor_template": EXECUTOR_TEMPLATE
+        "executor_template": EXECUTOR_TEMPLATE,
+        "grouped_executor_template": GROUPED_EXECUTOR_TEMPLATE
     }
 
 
@@ -0,0 +1,217 @@
+"""
+Azure Batch Runner
+======================
+
+Submits bulk planning and subtask workloads through the Azure OpenAI Batch API. Batch jobs
+trade latency (up to 24h) for lower cost and higher throughput, which suits
+offline re-processing and evaluation runs rather than live requests.
+"""
+
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+
+from agentic_skeleton.config import settings
+from agentic_skeleton.utils.helpers import extract_subtasks_from_text
+from agentic_skeleton.core.azure.client import initialize_client, DEFAULT_TEMPERATURE
+from agentic_skeleton.core.azure.classifier import classify_request, detect_domain_specialization
+from agentic_skeleton.core.azure.generator import build_plan_prompt, build_subtask_prompt
+from agentic_skeleton.core.azure.constants.fallback_plans import get_fallback_plan
+
+BATCH_ENDPOINT = "/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30  # seconds
+
+# Batch statuses after which polling stops
+_TERMINAL_STATUSES = frozenset(["completed", "failed", "expired", "cancelled"])
+
+
+def build_batch_file(prompts: List[str], model: str) -> bytes:
+    """
+    Serialize prompts into Batch API JSONL, one chat completion per line.
+    
+    Args:
+        prompts: Fully built prompts, in order
+        model: The model deployment name
+        
+    Returns:
+        JSONL file content; line i has custom_id "request-i"
+    """
+    lines = [
+        json.dumps({
+            "custom_id": f"request-{i}",
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": model,
+                "messages": [{"role": "system", "content": prompt}],
+                "temperature": DEFAULT_TEMPERATURE
+            }
+        })
+        for i, prompt in enumerate(prompts)
+    ]
+    return "\n".join(lines).encode("utf-8")
+
+
+def parse_batch_output(output_text: str) -> Dict[str, str]:
+    """
+    Parse Batch API output JSONL into completion text keyed by custom_id.
+    
+    Args:
+        output_text: Content of the batch output file
+        
+    Returns:
+        Dictionary of custom_id to completion text or error message
+    """
+    results = {}
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+        else:
+            results[record["custom_id"]] = f"Error: {record.get('error') or response.get('body')}"
+    return results
+
+
+def run_batch(prompts: List[str], model: str, file_name: str,
+              poll_interval: float = BATCH_POLL_INTERVAL,
+              max_wait: Optional[float] = None) -> Dict[str, str]:
+    """
+    Submit prompts as one Azure OpenAI batch job and wait for its output.
+    
+    Args:
+        prompts: Fully built prompts, in order
+        model: The model deployment name
+        file_name: Name for the uploaded JSONL input file
+        poll_interval: Seconds between batch status checks
+        max_wait: Seconds to wait before cancelling the batch (defaults to settings.BATCH_MAX_WAIT)
+        
+    Returns:
+        Dictionary of custom_id ("request-i") to completion text or error message;
+        empty if the client is unavailable or the batch did not complete in time
+    """
+    client_wrapper = initialize_client()
+    if not client_wrapper:
+        logging.error("Azure OpenAI client not initialized; cannot submit batch")
+        return {}
+    client = client_wrapper.client
+    
+    # 1. Upload the JSONL input and start the batch job
+    input_file = client.files.create(
+        file=(file_name, build_batch_file(prompts, model)),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW
+    )
+    logging.info("Submitted Azure OpenAI batch %s with %d requests", batch.id, len(prompts))
+    
+    # 2. Poll until the batch finishes, cancelling it once the deadline passes
+    deadline = time.monotonic() + (max_wait if max_wait is not None else settings.BATCH_MAX_WAIT)
+    while batch.status not in _TERMINAL_STATUSES:
+        if time.monotonic() >= deadline:
+            logging.error("Azure OpenAI batch %s still %s after the wait limit; cancelling", batch.id, batch.status)
+            try:
+                client.batches.cancel(batch.id)
+            except Exception as e:
+                logging.error("Failed to cancel Azure OpenAI batch %s: %s", batch.id, e)
+            return {}
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    
+    # 3. Download and parse the results
+    if batch.status == "completed" and batch.output_file_id:
+        return parse_batch_output(client.files.content(batch.output_file_id).text)
+    logging.error("Azure OpenAI batch %s ended with status: %s", batch.id, batch.status)
+    return {}
+
+
+def process_plan_batch(user_requests: List[str], model: Optional[str] = None,
+                       poll_interval: float = BATCH_POLL_INTERVAL,
+                       max_wait: Optional[float] = None) -> List[List[str]]:
+    """
+    Generate plans for many requests with a single Azure OpenAI batch job.
+    
+    Prompts are built locally exactly as generate_plan builds them, then uploaded
+    together. Blocks until the batch reaches a terminal status or max_wait
+    passes. Requests whose plan cannot be extracted, including every request of
+    a timed-out batch, get the category fallback plan, as in generate_plan.
+    
+    Args:
+        user_requests: The user requests to plan
+        model: The model deployment name (defaults to settings.MODEL_PLANNER)
+        poll_interval: Seconds between batch status checks
+        max_wait: Seconds to wait before cancelling the batch (defaults to settings.BATCH_MAX_WAIT)
+        
+    Returns:
+        List of subtask lists, in the same order as user_requests
+    """
+    # 1. Build every planner prompt locally
+    categories, prompts = [], []
+    for user_request in user_requests:
+        request_category, enhanced_prompt = build_plan_prompt(user_request)
+        categories.append(request_category)
+        prompts.append(enhanced_prompt)
+    
+    # 2. Run them as one batch job
+    outputs = run_batch(prompts, model or settings.MODEL_PLANNER, "plan_batch.jsonl", poll_interval, max_wait)
+    
+    # 3. Extract subtasks, falling back per request when extraction fails
+    plans = []
+    for i, request_category in enumerate(categories):
+        plan_text = outputs.get(f"request-{i}", "")
+        subtasks = [] if plan_text.startswith("Error:") else extract_subtasks_from_text(plan_text)
+        if not subtasks:
+            logging.warning("No plan extracted for batch request %d, using fallback", i)
+            subtasks = get_fallback_plan(request_category)
+        plans.append(subtasks)
+    return plans
+
+
+def execute_subtasks_batch(subtasks: List[str], user_request: str, model: Optional[str] = None,
+                           poll_interval: float = BATCH_POLL_INTERVAL,
+                           max_wait: Optional[float] = None) -> List[Dict[str, str]]:
+    """
+    Execute all subtasks of a plan with a single Azure OpenAI batch job.
+    
+    Prompts are built exactly as execute_subtasks builds them. Blocks until the
+    batch reaches a terminal status or max_wait passes, so this suits
+    non-interactive runs only. Subtasks without a batch result get an error result.
+    
+    Args:
+        subtasks: List of subtask descriptions
+        user_request: The original user request for domain context
+        model: The model deployment name (defaults to settings.MODEL_EXECUTOR)
+        poll_interval: Seconds between batch status checks
+        max_wait: Seconds to wait before cancelling the batch (defaults to settings.BATCH_MAX_WAIT)
+        
+    Returns:
+        List of dictionaries with subtask descriptions, results and types, in subtask order
+    """
+    # 1. Classify once and build every executor prompt locally
+    request_category = classify_request(user_request)
+    domain_info = detect_domain_specialization(user_request)
+    prepared = [
+        build_subtask_prompt(task, user_request, request_category, domain_info)
+        for task in subtasks
+    ]
+    
+    # 2. Run them as one batch job
+    outputs = run_batch([prompt for _, prompt in prepared], model or settings.MODEL_EXECUTOR,
+                        "subtask_batch.jsonl", poll_interval, max_wait)
+    
+    # 3. Hydrate results by custom_id
+    return [
+        {
+            "task": task,
+            "result": outputs.get(f"request-{i}", "Error: No batch result for subtask"),
+            "type": subtask_type
+        }
+        for i, (task, (subtask_type, _)) in enumerate(zip(subtasks, prepared))
+    ]
@@ -0,0 +1,152 @@
+"""
+Azure Response Cache
+======================
+
+In-process caches for Azure OpenAI work:
+- Exact-match completion cache so identical prompts skip the API call
+- Semantic cache so user requests differing only in case, punctuation or whitespace reuse an earlier plan and results
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from agentic_skeleton.config import settings
+
+_TOKEN_RE = re.compile(r"\w+")
+
+class ResponseCache:
+    """
+    Thread-safe exact-match cache of completions keyed by model and prompt.
+    
+    Bounded to max_entries; the least recently used completion is evicted first.
+    """
+    
+    max_entries = 4096
+    
+    def __init__(self):
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+    @property
+    def enabled(self) -> bool:
+        """Whether response caching is switched on in the settings"""
+        return settings.LLM_CACHE_ENABLED
+        
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float) -> str:
+        """Build a stable, fixed-size key for a completion request"""
+        raw = repr((model, prompt, temperature)).encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+        
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for a key, or None on a miss"""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+            
+    def set(self, key: str, response: str):
+        """Store a completion under a key, evicting the least recently used beyond max_entries"""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            
+    def clear(self):
+        """Remove all cached completions"""
+        with self._lock:
+            self._entries.clear()
+            
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Normalized-request cache that reuses results for reworded duplicates.
+    
+    Requests are keyed by their lowercased word tokens in order, so requests
+    that differ only in case, punctuation or whitespace hit the cache, while
+    any change of wording or word order misses ("from MySQL to PostgreSQL"
+    is not "from PostgreSQL to MySQL"). Entries older than the TTL are
+    ignored, so cached plans do not outlive changes to prompts or models.
+    """
+    
+    max_entries = 1024
+    
+    def __init__(self, ttl: Optional[float] = None):
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+    @property
+    def enabled(self) -> bool:
+        """Whether semantic caching is switched on in the settings"""
+        return settings.SEMANTIC_CACHE_ENABLED
+        
+    @property
+    def ttl(self) -> float:
+        """Seconds an entry stays valid; 0 or less disables expiry"""
+        if self._ttl is not None:
+            return self._ttl
+        return settings.SEMANTIC_CACHE_TTL
+        
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Reduce a request to its lowercased word tokens, keeping their order"""
+        return " ".join(_TOKEN_RE.findall(text.lower()))
+        
+    def lookup(self, text: str) -> Optional[Any]:
+        """Return the response cached for an equivalent request, or None"""
+        key = self.normalize(text)
+        if not key:
+            return None
+            
+        with self._lock:
+            self._expire()
+            entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+        
+    def add(self, text: str, response: Any):
+        """Store a response for a request, evicting the oldest entry when full"""
+        key = self.normalize(text)
+        if not key:
+            return
+            
+        with self._lock:
+            self._expire()
+            self._entries.pop(key, None)
+            self._entries[key] = (response, time.monotonic())
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            
+    def _expire(self):
+        """Drop entries older than the TTL; entries are in insertion order, so stop at the first fresh one"""
+        ttl = self.ttl
+        if ttl <= 0:
+            return
+        cutoff = time.monotonic() - ttl
+        while self._entries:
+            oldest_key = next(iter(self._entries))
+            if self._entries[oldest_key][1] > cutoff:
+                break
+            del self._entries[oldest_key]
+            
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache instances shared by all Azure calls
+response_cache = ResponseCache()
+semantic_cache = SemanticCache()
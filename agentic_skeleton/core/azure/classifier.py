@@ -6,13 +6,84 @@ Provides classification functionality for user requests and subtasks for Azure i
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from agentic_skeleton.core.azure.constants import REQUEST_CLASSIFIERS, COMPLEX_TASK_INDICATORS, GENERIC_SUBTASK_PATTERNS
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Any, Mapping, Optional, Tuple
+from agentic_skeleton.core.azure.constants import (
+    REQUEST_CLASSIFIERS, COMPLEX_TASK_INDICATORS, GENERIC_SUBTASK_PATTERNS, DOMAIN_KNOWLEDGE
+)
 
+# Request classification is a pure function of the request text, and every request
+# is classified several times (plan prompt, subtask execution), so results are memoized
+CLASSIFICATION_CACHE_SIZE = 2048
+
+# Shared read-only result for requests without a specialized domain
+_NO_DOMAIN: Mapping[str, Any] = MappingProxyType({})
+
+def _compile_any(patterns) -> re.Pattern:
+    """Compile a single alternation that finds whether any of the patterns occurs as a substring"""
+    # Every alternative is an escaped literal: with no quantifiers or groups there is
+    # nothing to backtrack into, so a scan stays linear in the text for a fixed pattern set
+    alternatives = [re.escape(pattern) for pattern in patterns]
+    # An empty alternation would match everywhere; an empty list must match nothing
+    return re.compile("|".join(alternatives) if alternatives else "(?!)")
+
+# One precompiled scan per keyword family. Most texts match nothing in a family, and a
+# single regex pass rules that out before the per-category substring checks run.
+_ANY_REQUEST_PATTERN_RE = _compile_any(
+    pattern for classifier in REQUEST_CLASSIFIERS for pattern in classifier["patterns"]
+)
+_ANY_DOMAIN_KEYWORD_RE = _compile_any(
+    kw for domain_data in DOMAIN_KNOWLEDGE.values() for kw in domain_data["keywords"]
+)
+_ANY_GENERIC_SUBTASK_RE = _compile_any(
+    pattern for patterns in GENERIC_SUBTASK_PATTERNS.values() for pattern in patterns
+)
+
+# Request patterns compiled to one regex per category, so categories the request
+# does not mention are skipped before their patterns are counted
+_REQUEST_CLASSIFIER_RES = tuple(
+    (classifier["type"], classifier["patterns"], _compile_any(classifier["patterns"]))
+    for classifier in REQUEST_CLASSIFIERS
+)
+
+# Subtask patterns compiled to one regex per subtask type, in classification order
+_GENERIC_SUBTASK_RES = tuple(
+    (subtask_type, _compile_any(patterns)) for subtask_type, patterns in GENERIC_SUBTASK_PATTERNS.items()
+)
+_DOMAIN_SUBTASK_RES = {
+    domain_name: (
+        domain_data["subtasks"],
+        tuple((subtask_type, _compile_any(patterns)) for subtask_type, patterns in domain_data["subtasks"].items())
+    )
+    for domain_name, domain_data in DOMAIN_KNOWLEDGE.items()
+}
+
+# Read-only domain info for every (domain, keyword) pair, built once so that
+# detection returns a shared instance instead of building a mapping per request
+_DOMAIN_INFOS = {
+    domain_name: tuple(
+        (kw, MappingProxyType({
+            "name": domain_name,
+            "matched_keyword": kw,
+            "subtasks": domain_data["subtasks"],
+            "guidance": domain_data["guidance"],
+            "preferred_category": domain_data["preferred_category"]
+        }))
+        for kw in domain_data["keywords"]
+    )
+    for domain_name, domain_data in DOMAIN_KNOWLEDGE.items()
+}
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
 def classify_request(user_request: str) -> str:
     """
     Classify a user request into one of the predefined categories.
     
+    Results are memoized on the request text as given, so a repeated request
+    is answered from the cache without being lowercased again.
+    
     Args:
         user_request: The user request text
         
@@ -24,22 +95,25 @@ def classify_request(user_request: str) -> str:
     # Check for complex multi-domain tasks
     explicit_complex_task = (
         any(term in request_lower for term in COMPLEX_TASK_INDICATORS) and 
-        len(request_lower.split()) > 15
+        # maxsplit stops after the 16th word: only "more than 15" matters
+        len(request_lower.split(None, 15)) > 15
     )
     
-    # Check for multiple domain matches
+    # Check for multiple domain matches (skipped when no pattern occurs at all)
     domain_matches = []
-    for classifier in REQUEST_CLASSIFIERS:
-        matches = sum(1 for pattern in classifier["patterns"] if pattern in request_lower)
-        if matches > 0:
-            domain_matches.append((classifier["type"], matches))
+    if _ANY_REQUEST_PATTERN_RE.search(request_lower):
+        for request_type, patterns, regex in _REQUEST_CLASSIFIER_RES:
+            if regex.search(request_lower):
+                # Score is the number of distinct patterns present, overlaps included
+                matches = sum(1 for pattern in patterns if pattern in request_lower)
+                domain_matches.append((request_type, matches))
     
     # Handle complex tasks or multiple domain matches
     if explicit_complex_task or len(domain_matches) > 1:
         if domain_matches:
             # Use the most dominant theme for complex tasks
             dominant_type = max(domain_matches, key=lambda x: x[1])[0]
-            logging.info(f"Complex task detected. Using dominant classification: {dominant_type}")
+            logging.info("Complex task detected. Using dominant classification: %s", dominant_type)
             return dominant_type
         else:
             return "data-science"
@@ -47,61 +121,101 @@ def classify_request(user_request: str) -> str:
     # Handle simple tasks with a single domain
     if domain_matches:
         plan_type = domain_matches[0][0]
-        logging.info(f"Request classified as: {plan_type}")
+        logging.info("Request classified as: %s", plan_type)
         return plan_type
     
     # Default classification
     return "default"
 
 
-def detect_domain_specialization(user_request: str) -> Dict[str, Any]:
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def detect_domain_specialization(user_request: str) -> Mapping[str, Any]:
     """
     Detect specialized domain knowledge required for the request.
     
+    Results are read-only mappings shared between callers: one instance exists
+    per (domain, matched keyword) pair.
+    
     Args:
         user_request: The user's request text
         
     Returns:
-        Dictionary with domain information including name, keywords, and subtask patterns
+        Mapping with domain information including name, keywords, and subtask patterns
     """
-    from agentic_skeleton.core.azure.constants.domain_knowledge import DOMAIN_KNOWLEDGE
-    
     request_lower = user_request.lower()
     
+    # Most requests match no domain; a single regex scan rules them out
+    if not _ANY_DOMAIN_KEYWORD_RE.search(request_lower):
+        return _NO_DOMAIN
+    
     # Check for domain matches
-    for domain_name, domain_data in DOMAIN_KNOWLEDGE.items():
-        if any(keyword in request_lower for keyword in domain_data["keywords"]):
-            # Extract matching keyword for reference
-            matching_keyword = next((kw for kw in domain_data["keywords"] if kw in request_lower), domain_data["keywords"][0])
-            
-            domain_info = {
-                "name": domain_name,
-                "matched_keyword": matching_keyword,
-                "subtasks": domain_data["subtasks"],
-                "guidance": domain_data["guidance"],
-                "preferred_category": domain_data["preferred_category"]
-            }
-            
-            logging.info(f"Detected specialized domain: {domain_name}")
+    for domain_name, keyword_infos in _DOMAIN_INFOS.items():
+        # Single pass: stop at the first matching keyword and keep it for reference
+        domain_info = next((info for kw, info in keyword_infos if kw in request_lower), None)
+        if domain_info is not None:
+            logging.info("Detected specialized domain: %s", domain_name)
             return domain_info
     
-    # Return empty dict if no specialized domain detected
-    return {}
+    # Return an empty mapping if no specialized domain detected
+    return _NO_DOMAIN
 
 
 def classify_subtask(subtask: str, domain_info: Dict[str, Any]) -> str:
     """
     Classify the type of subtask to provide more specialized execution.
     
+    Subtasks of detected domains are memoized per (subtask, domain name); a
+    caller-supplied pattern table is matched directly.
+    
     Args:
         subtask: The subtask description
         domain_info: Domain specialization information
         
+    Returns:
+        Subtask type classification
+    """
+    if domain_info and "subtasks" in domain_info:
+        domain_name = domain_info.get("name")
+        known_subtasks, _ = _DOMAIN_SUBTASK_RES.get(domain_name, (None, ()))
+        if domain_info["subtasks"] is not known_subtasks:
+            subtask_lower = subtask.lower()
+            matches = ((subtask_type, any(pattern in subtask_lower for pattern in patterns))
+                       for subtask_type, patterns in domain_info["subtasks"].items())
+            return _classify_subtask_text(subtask_lower, matches)
+        return _classify_known_subtask(subtask, domain_name)
+    return _classify_known_subtask(subtask, None)
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_known_subtask(subtask: str, domain_name: Optional[str]) -> str:
+    """
+    Classify a subtask against the shared knowledge table of a domain.
+    
+    Args:
+        subtask: The subtask description
+        domain_name: Name of the detected domain, or None for generic classification
+        
     Returns:
         Subtask type classification
     """
     subtask_lower = subtask.lower()
+    # Detected domains carry the shared knowledge table; use its precompiled regexes
+    _, compiled = _DOMAIN_SUBTASK_RES.get(domain_name, (None, ()))
+    matches = ((subtask_type, regex.search(subtask_lower)) for subtask_type, regex in compiled)
+    return _classify_subtask_text(subtask_lower, matches)
+
+
+def _classify_subtask_text(subtask_lower: str, domain_matches: Iterable[Tuple[str, Any]]) -> str:
+    """
+    Pick the subtask type from the special cases, domain matches and generic patterns.
     
+    Args:
+        subtask_lower: The lowercased subtask description
+        domain_matches: Lazy (subtask type, match) pairs for the domain, in priority order
+        
+    Returns:
+        Subtask type classification
+    """
     # Special case for "Document the system architecture" test
     if "document the system architecture" in subtask_lower:
         return "document"
@@ -111,16 +225,16 @@ def classify_subtask(subtask: str, domain_info: Dict[str, Any]) -> str:
         return "deploy"
     
     # Check domain-specific subtask patterns if domain detected
-    if domain_info and "subtasks" in domain_info:
-        for subtask_type, patterns in domain_info["subtasks"].items():
-            if any(pattern in subtask_lower for pattern in patterns):
-                logging.info(f"Subtask classified as domain-specific: {subtask_type}")
-                return subtask_type
+    for subtask_type, matched in domain_matches:
+        if matched:
+            logging.info("Subtask classified as domain-specific: %s", subtask_type)
+            return subtask_type
     
     # Generic subtask classification fallback
-    for subtask_type, patterns in GENERIC_SUBTASK_PATTERNS.items():
-        if any(pattern in subtask_lower for pattern in patterns):
-            return subtask_type
+    if _ANY_GENERIC_SUBTASK_RE.search(subtask_lower):
+        for subtask_type, regex in _GENERIC_SUBTASK_RES:
+            if regex.search(subtask_lower):
+                return subtask_type
     
     # Default subtask type
-    return "execute"
\ No newline at end of file
+    return "execute"
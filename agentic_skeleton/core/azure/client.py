@@ -6,22 +6,106 @@ Handles Azure OpenAI client initialization and API calls.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Iterator, Optional
 
-# Optional: Import Azure OpenAI only when needed
-try:
-    from openai import AzureOpenAI
-except ImportError:
-    AzureOpenAI = None
+# Optional: Import Azure OpenAI only when needed. The SDK takes most of a second
+# to import, so it is loaded on first client creation rather than at import time.
+_SDK_NOT_LOADED = object()
+AzureOpenAI = _SDK_NOT_LOADED
 
 from agentic_skeleton.config import settings
+from agentic_skeleton.core.azure.cache import response_cache
 
-# Global client instance
+# Global client instance, created once and shared by all requests
 azure_client_instance = None
+_client_lock = threading.Lock()
+
+# Sampling temperature used for all completions
+DEFAULT_TEMPERATURE = 0.3
+
+# Retries with exponential backoff on rate limits and transient errors
+MAX_RETRIES = 3
+
+
+class UsageStats:
+    """
+    Thread-safe running totals of token usage reported by Azure OpenAI.
+    
+    cached_tokens counts prompt tokens served from the service's prompt cache,
+    so cached_ratio shows how much of the prompt traffic reuses shared prefixes.
+    """
+    
+    __slots__ = ("calls", "prompt_tokens", "cached_tokens", "completion_tokens", "_lock")
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+        
+    def record(self, usage: Any):
+        """Add the usage block of one completion response; missing fields count as zero"""
+        prompt_tokens = _token_count(getattr(usage, "prompt_tokens", 0))
+        completion_tokens = _token_count(getattr(usage, "completion_tokens", 0))
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = _token_count(getattr(details, "cached_tokens", 0))
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_tokens += cached_tokens
+            self.completion_tokens += completion_tokens
+        logging.debug("Azure OpenAI usage: %d prompt tokens (%d cached), %d completion tokens",
+                      prompt_tokens, cached_tokens, completion_tokens)
+        
+    @property
+    def cached_ratio(self) -> float:
+        """Fraction of prompt tokens served from the prompt cache"""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+        
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current totals as a plain dictionary"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_tokens": self.cached_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cached_ratio": self.cached_ratio
+            }
+        
+    def reset(self):
+        """Zero all totals"""
+        with self._lock:
+            self.calls = 0
+            self.prompt_tokens = 0
+            self.cached_tokens = 0
+            self.completion_tokens = 0
+
+
+def _token_count(value: Any) -> int:
+    """Return a token count from a usage field, treating absent or non-integer values as zero"""
+    return value if isinstance(value, int) else 0
+
+
+# Token usage across all completions made by this process
+usage_stats = UsageStats()
+
+
+def _load_sdk_client_class():
+    """Import the AzureOpenAI class on first use; None if the SDK is not installed"""
+    global AzureOpenAI
+    if AzureOpenAI is _SDK_NOT_LOADED:
+        try:
+            from openai import AzureOpenAI as sdk_client_class
+        except ImportError:
+            sdk_client_class = None
+        AzureOpenAI = sdk_client_class
+    return AzureOpenAI
 
 class AzureOpenAIClient:
     """Client class for Azure OpenAI interactions"""
     
+    __slots__ = ("api_key", "azure_endpoint", "api_version", "client")
+    
     def __init__(self, api_key=None, azure_endpoint=None, api_version=None):
         self.api_key = api_key or settings.AZURE_KEY
         self.azure_endpoint = azure_endpoint or settings.AZURE_ENDPOINT
@@ -32,18 +116,19 @@ class AzureOpenAIClient:
     def initialize(self):
         """Initialize the underlying Azure OpenAI client"""
         try:
-            self.client = AzureOpenAI(
+            self.client = _load_sdk_client_class()(
                 api_key=self.api_key,
                 azure_endpoint=self.azure_endpoint,
-                api_version=self.api_version
+                api_version=self.api_version,
+                max_retries=MAX_RETRIES
             )
             logging.info("Azure OpenAI client initialized successfully")
             return True
         except Exception as e:
-            logging.error(f"Failed to initialize Azure OpenAI client: {e}")
+            logging.error("Failed to initialize Azure OpenAI client: %s", e)
             return False
             
-    def generate_completion(self, model, prompt, temperature=0.3):
+    def generate_completion(self, model, prompt, temperature=DEFAULT_TEMPERATURE):
         """Generate a completion using the Azure OpenAI API"""
         if not self.client:
             return "Error: Azure OpenAI client not initialized"
@@ -54,11 +139,33 @@ class AzureOpenAIClient:
                 messages=[{"role": "system", "content": prompt}],
                 temperature=temperature
             )
+            usage_stats.record(getattr(response, "usage", None))
             return response.choices[0].message.content.strip()
         except Exception as e:
             error_msg = f"Azure OpenAI API call failed: {e}"
             logging.error(error_msg)
             return f"Error: {str(e)}"
+            
+    def stream_completion(self, model, prompt, temperature=DEFAULT_TEMPERATURE) -> Iterator[str]:
+        """Stream a completion from the Azure OpenAI API as text fragments"""
+        if not self.client:
+            yield "Error: Azure OpenAI client not initialized"
+            return
+            
+        try:
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=[{"role": "system", "content": prompt}],
+                temperature=temperature,
+                stream=True
+            )
+            for chunk in stream:
+                # Azure may send chunks without choices (e.g. content filter results)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logging.error("Azure OpenAI streaming call failed: %s", e)
+            yield f"Error: {str(e)}"
 
 
 def initialize_client() -> Optional[AzureOpenAIClient]:
@@ -74,16 +181,21 @@ def initialize_client() -> Optional[AzureOpenAIClient]:
     if azure_client_instance and azure_client_instance.client:
         return azure_client_instance
     
-    # 2. Validate configuration settings
-    if not settings.validate_azure_config():
-        logging.warning("Azure OpenAI credentials not found or incomplete")
+    with _client_lock:
+        # Another thread may have created the client while we waited
+        if azure_client_instance and azure_client_instance.client:
+            return azure_client_instance
+        
+        # 2. Validate configuration settings
+        if not settings.validate_azure_config():
+            logging.warning("Azure OpenAI credentials not found or incomplete")
+            return None
+        
+        # 3. Create new client instance
+        azure_client_instance = AzureOpenAIClient()
+        if azure_client_instance.client:
+            return azure_client_instance
         return None
-    
-    # 3. Create new client instance
-    azure_client_instance = AzureOpenAIClient()
-    if azure_client_instance.client:
-        return azure_client_instance
-    return None
 
 
 def call_azure_openai(model: str, prompt: str) -> str:
@@ -100,7 +212,61 @@ def call_azure_openai(model: str, prompt: str) -> str:
     # 1. Get the client instance
     client_wrapper = initialize_client()
     if not client_wrapper:
-        return "Azure OpenAI client not initialized"
+        return "Error: Azure OpenAI client not initialized"
+    
+    # 2. Serve repeated prompts from the response cache when enabled
+    cache_key = None
+    if response_cache.enabled:
+        cache_key = response_cache.make_key(model, prompt, DEFAULT_TEMPERATURE)
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            logging.info("Serving Azure OpenAI response from cache")
+            return cached_response
+    
+    # 3. Make API call using the client wrapper
+    response_text = client_wrapper.generate_completion(model, prompt)
+    
+    # 4. Cache successful completions only
+    if cache_key and not response_text.startswith("Error:"):
+        response_cache.set(cache_key, response_text)
+    
+    return response_text
+
+
+def stream_azure_openai(model: str, prompt: str) -> Iterator[str]:
+    """
+    Stream an Azure OpenAI completion so callers can act on text as it arrives.
+    
+    Args:
+        model: The model deployment name
+        prompt: The prompt to send to the model
+        
+    Yields:
+        Fragments of the generated text; errors arrive as a fragment starting with "Error:"
+    """
+    # 1. Get the client instance
+    client_wrapper = initialize_client()
+    if not client_wrapper:
+        yield "Error: Azure OpenAI client not initialized"
+        return
+    
+    # 2. Serve repeated prompts from the response cache when enabled
+    cache_key = None
+    if response_cache.enabled:
+        cache_key = response_cache.make_key(model, prompt, DEFAULT_TEMPERATURE)
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            logging.info("Serving Azure OpenAI response from cache")
+            yield cached_response
+            return
+    
+    # 3. Stream the completion, keeping the fragments for the cache
+    parts = []
+    for fragment in client_wrapper.stream_completion(model, prompt):
+        parts.append(fragment)
+        yield fragment
     
-    # 2. Make API call using the client wrapper
-    return client_wrapper.generate_completion(model, prompt)
\ No newline at end of file
+    # 4. Cache successful completions only
+    response_text = "".join(parts).strip()
+    if cache_key and response_text and not any(part.startswith("Error:") for part in parts):
+        response_cache.set(cache_key, response_text)
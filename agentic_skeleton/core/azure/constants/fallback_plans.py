@@ -6,67 +6,72 @@ Provides fallback plans to use when plan generation fails.
 These are used as a last resort when the Azure OpenAI call fails or returns unusable results.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, Tuple, Any
 
-# Fallback plans for different request categories
-FALLBACK_PLANS = {
-    "write": [
+# Fallback plans for different request categories. Plans are tuples so one shared
+# instance can be returned to every caller without copying.
+FALLBACK_PLANS: Dict[str, Tuple[str, ...]] = {
+    "write": (
         "Research the topic and gather relevant information",
         "Create an outline with key points and structure",
         "Draft the initial content following the outline",
         "Review and revise the content for clarity and coherence",
         "Edit for grammar, style, and formatting",
         "Prepare the final version with any necessary citations"
-    ],
+    ),
     
-    "analyze": [
+    "analyze": (
         "Define the scope and objectives of the analysis",
         "Gather and organize relevant data and information",
         "Identify patterns, trends, and insights from the data",
         "Evaluate the findings against established criteria or benchmarks",
         "Draw conclusions based on the analysis",
         "Formulate recommendations based on the conclusions"
-    ],
+    ),
     
-    "develop": [
+    "develop": (
         "Gather requirements and define specifications",
         "Design the system architecture and component interactions",
         "Implement the core functionality and features",
         "Create tests to verify correctness and performance",
         "Debug issues and optimize the implementation",
         "Document the system architecture and usage instructions"
-    ],
+    ),
     
-    "design": [
+    "design": (
         "Research user needs and create user personas",
         "Define information architecture and user flows",
         "Create wireframes and low-fidelity mockups",
         "Develop high-fidelity visual designs",
         "Prepare prototypes for user testing",
         "Finalize design assets and specifications"
-    ],
+    ),
     
-    "data-science": [
+    "data-science": (
         "Define the problem statement and analysis objectives",
         "Collect and prepare the dataset for analysis",
         "Perform exploratory data analysis to understand patterns",
         "Engineer features and preprocess data for modeling",
         "Train and evaluate machine learning models",
         "Deploy the model and create a system for predictions"
-    ],
+    ),
     
-    "default": [
+    "default": (
         "Research the topic and gather relevant information",
         "Analyze the key components and requirements",
         "Develop an initial solution or approach",
         "Test and validate the solution",
         "Refine and optimize based on testing results",
         "Prepare final documentation and delivery"
-    ]
+    )
 }
 
 
-def get_fallback_plan(request_category: str, domain_info: Dict[str, Any] = None) -> List[str]:
+# Plan for categories without a specific fallback
+_DEFAULT_PLAN = FALLBACK_PLANS["default"]
+
+
+def get_fallback_plan(request_category: str, domain_info: Dict[str, Any] = None) -> Tuple[str, ...]:
     """
     Get a fallback plan based on the request category and domain info.
     
@@ -75,7 +80,7 @@ def get_fallback_plan(request_category: str, domain_info: Dict[str, Any] = None)
         domain_info: Optional domain specialization information
         
     Returns:
-        A list of fallback subtasks
+        A shared, read-only tuple of fallback subtasks
     """
     # If we have domain info, and it has a preferred category, use that
     if domain_info and "preferred_category" in domain_info:
@@ -84,7 +89,4 @@ def get_fallback_plan(request_category: str, domain_info: Dict[str, Any] = None)
             return FALLBACK_PLANS[preferred_category]
     
     # Otherwise use the detected category or fall back to default
-    if request_category in FALLBACK_PLANS:
-        return FALLBACK_PLANS[request_category]
-    else:
-        return FALLBACK_PLANS["default"]
\ No newline at end of file
+    return FALLBACK_PLANS.get(request_category, _DEFAULT_PLAN)
\ No newline at end of file
@@ -3,50 +3,157 @@ Azure Prompt Enhancer
 ======================
 
 Enhances prompts with domain-specific knowledge and request context for Azure OpenAI.
+
+Enhanced prompts put the most widely shared text first (category and domain
+guidance), then per-request and per-subtask context, and the prompt template
+with the user's text last. Prompts for the same category and domain therefore
+start with a byte-identical prefix, which the service's prompt caching can reuse.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from agentic_skeleton.core.azure.constants.prompt_guidance import TASK_GUIDANCE, SUBTASK_GUIDANCE, STAGE_GUIDANCE
 
-def enhance_prompt_with_domain_knowledge(prompt: str, user_request: str, 
-                                        request_category: str = "", 
-                                        domain_info: Dict[str, Any] = {}) -> str:
+# Guidance sections pre-rendered once per category, subtask type and stage.
+# Each section ends with a blank line separating it from whatever follows.
+_CATEGORY_SECTIONS = {
+    category: f"Task Category: {category.capitalize()}\n{guidance}\n\n"
+    for category, guidance in TASK_GUIDANCE.items() if guidance
+}
+_SUBTASK_SECTIONS = {
+    subtask_type: f"Subtask Type: {subtask_type.capitalize()}\n{guidance}\n\n"
+    for subtask_type, guidance in SUBTASK_GUIDANCE.items() if guidance
+}
+_STAGE_SECTIONS = {stage: f"{guidance}\n\n" for stage, guidance in STAGE_GUIDANCE.items()}
+
+_FORMAL_TONE_SECTION = "Please maintain a formal, technical tone appropriate for professional audiences.\n\n"
+
+# Request terms that call for a formal tone or for thorough research
+_FORMAL_TONE_TERMS = ("technical", "professional", "formal", "detailed")
+_THOROUGHNESS_TERMS = ("comprehensive", "thorough", "detailed")
+
+# Subtask terms that select the creation or refinement stage guidance
+_CREATION_TERMS = ("draft", "create", "write", "develop")
+_REFINEMENT_TERMS = ("refine", "improve", "optimize", "edit")
+
+
+@lru_cache(maxsize=256)
+def _request_style(user_request: str) -> Tuple[bool, bool]:
     """
-    Enhance a prompt with domain-specific knowledge and request categorization.
+    Detect the tone and depth the user asked for.
+    
+    Every subtask prompt for a request re-checks the same request text, so the
+    result is memoized per request.
+    
+    Args:
+        user_request: The user's request text
+        
+    Returns:
+        Tuple of (wants_formal_tone, wants_thorough_research)
+    """
+    request_lower = user_request.lower()
+    return (
+        any(term in request_lower for term in _FORMAL_TONE_TERMS),
+        any(term in request_lower for term in _THOROUGHNESS_TERMS)
+    )
+
+
+@lru_cache(maxsize=256)
+def _domain_section(name: str, guidance: str) -> str:
+    """
+    Render the domain specialization section of a prompt.
+    
+    The section depends only on the domain, so each one is rendered once and
+    shared by every prompt for that domain.
+    
+    Args:
+        name: The domain name
+        guidance: The domain guidance text
+        
+    Returns:
+        Domain section text
+    """
+    return f"Domain Specialization: {name}\n{guidance}\n\n"
+
+
+def _shared_prompt_prefix(user_request: str, request_category: str,
+                          domain_info: Dict[str, Any]) -> str:
+    """
+    Render the category, domain and tone sections that precede every prompt for a request.
     
     Args:
-        prompt: The original prompt template
         user_request: The user's request text
         request_category: The classified request category
         domain_info: Domain specialization information
         
     Returns:
-        Enhanced prompt with relevant knowledge and context
+        Prompt prefix text, possibly empty
     """
-    enhanced_prompt = prompt
+    if not domain_info:
+        return _render_shared_prefix(user_request, request_category, None, None, None)
+    return _render_shared_prefix(user_request, request_category, domain_info['name'],
+                                 domain_info.get('guidance', ''), domain_info.get('matched_keyword'))
+
+
+@lru_cache(maxsize=256)
+def _render_shared_prefix(user_request: str, request_category: str, domain_name: Optional[str],
+                          domain_guidance: Optional[str], matched_keyword: Optional[str]) -> str:
+    """
+    Render the shared prompt prefix from hashable request and domain fields.
+    
+    The plan prompt and every subtask prompt of a request share this prefix, so
+    it is rendered once per request and reused.
+    
+    Args:
+        user_request: The user's request text
+        request_category: The classified request category
+        domain_name: The detected domain name, or None without a domain
+        domain_guidance: The domain guidance text
+        matched_keyword: The keyword that selected the domain
+        
+    Returns:
+        Prompt prefix text, possibly empty
+    """
+    parts = []
     
     # 1. Add request category information
-    if request_category:
-        category_guidance = TASK_GUIDANCE.get(request_category, "")
-        if category_guidance:
-            enhanced_prompt += f"\n\nTask Category: {request_category.capitalize()}\n{category_guidance}\n"
+    category_section = _CATEGORY_SECTIONS.get(request_category)
+    if category_section:
+        parts.append(category_section)
     
     # 2. Add domain-specific knowledge if available
-    if domain_info:
-        domain_prompt = f"\n\nDomain Specialization: {domain_info['name']}\n"
-        domain_prompt += f"{domain_info.get('guidance', '')}\n"
-        
-        if domain_info.get('matched_keyword'):
-            domain_prompt += f"Topic keyword: {domain_info['matched_keyword']}\n"
-            
-        enhanced_prompt += domain_prompt
+    if domain_name is not None:
+        parts.append(_domain_section(domain_name, domain_guidance))
     
     # 3. Check for technical and professional tone
-    if any(term in user_request.lower() for term in ["technical", "professional", "formal", "detailed"]):
-        enhanced_prompt += "\n\nPlease maintain a formal, technical tone appropriate for professional audiences."
+    wants_formal_tone, _ = _request_style(user_request)
+    if wants_formal_tone:
+        parts.append(_FORMAL_TONE_SECTION)
     
-    return enhanced_prompt
+    # 4. Add the keyword that selected the domain; it varies per request, so it comes last
+    if matched_keyword:
+        parts.append(f"Topic keyword: {matched_keyword}\n\n")
+    
+    return "".join(parts)
+
+
+def enhance_prompt_with_domain_knowledge(prompt: str, user_request: str, 
+                                        request_category: str = "", 
+                                        domain_info: Dict[str, Any] = {}) -> str:
+    """
+    Enhance a prompt with domain-specific knowledge and request categorization.
+    
+    Args:
+        prompt: The original prompt template
+        user_request: The user's request text
+        request_category: The classified request category
+        domain_info: Domain specialization information
+        
+    Returns:
+        Enhanced prompt with relevant knowledge and context
+    """
+    return _shared_prompt_prefix(user_request, request_category, domain_info) + prompt
 
 
 def enhance_subtask_prompt(prompt: str, user_request: str, subtask: str, 
@@ -67,22 +174,24 @@ def enhance_subtask_prompt(prompt: str, user_request: str, subtask: str,
     Returns:
         Enhanced prompt optimized for the specific subtask
     """
-    # Start with domain knowledge enhancement
-    enhanced_prompt = enhance_prompt_with_domain_knowledge(prompt, user_request, request_category, domain_info)
+    # Start with the sections shared by every prompt for the request
+    parts = [_shared_prompt_prefix(user_request, request_category, domain_info)]
     
     # Add subtask-specific guidance
-    if subtask_type:
-        guidance = SUBTASK_GUIDANCE.get(subtask_type, "")
-        if guidance:
-            enhanced_prompt += f"\n\nSubtask Type: {subtask_type.capitalize()}\n{guidance}\n"
+    subtask_section = _SUBTASK_SECTIONS.get(subtask_type)
+    if subtask_section:
+        parts.append(subtask_section)
     
     # Add stage awareness
     subtask_lower = subtask.lower()
-    if "research" in subtask_lower and any(term in user_request.lower() for term in ["comprehensive", "thorough", "detailed"]):
-        enhanced_prompt += f"\n\n{STAGE_GUIDANCE['research']}"
-    elif any(term in subtask_lower for term in ["draft", "create", "write", "develop"]):
-        enhanced_prompt += f"\n\n{STAGE_GUIDANCE['creation']}"
-    elif any(term in subtask_lower for term in ["refine", "improve", "optimize", "edit"]):
-        enhanced_prompt += f"\n\n{STAGE_GUIDANCE['refinement']}"
-    
-    return enhanced_prompt
\ No newline at end of file
+    _, wants_thorough_research = _request_style(user_request)
+    if "research" in subtask_lower and wants_thorough_research:
+        parts.append(_STAGE_SECTIONS['research'])
+    elif any(term in subtask_lower for term in _CREATION_TERMS):
+        parts.append(_STAGE_SECTIONS['creation'])
+    elif any(term in subtask_lower for term in _REFINEMENT_TERMS):
+        parts.append(_STAGE_SECTIONS['refinement'])
+    
+    # The prompt template carries the subtask text, so it goes last
+    parts.append(prompt)
+    return "".join(parts)
@@ -6,30 +6,29 @@ Provides functionality for generating plans and executing subtasks using Azure O
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
 from agentic_skeleton.config import settings
-from agentic_skeleton.utils.helpers import extract_subtasks_from_text
+from agentic_skeleton.utils.helpers import extract_subtasks_from_text, iter_subtasks_from_chunks
 from agentic_skeleton.core.azure.classifier import classify_request, detect_domain_specialization, classify_subtask
-from agentic_skeleton.core.azure.client import call_azure_openai
+from agentic_skeleton.core.azure.client import call_azure_openai, stream_azure_openai
 from agentic_skeleton.core.azure.enhancer import enhance_prompt_with_domain_knowledge, enhance_subtask_prompt
 from agentic_skeleton.core.azure.constants.fallback_plans import get_fallback_plan
 
 # ----------------------------------------
 #  STEP 1: GENERATE PLAN WITH AZURE OPENAI
 # ----------------------------------------
-def generate_plan(user_request: str) -> List[str]:
+def build_plan_prompt(user_request: str) -> Tuple[str, str]:
     """
-    Generate a plan using Azure OpenAI.
+    Build the domain-enhanced planner prompt for a request.
     
     Args:
         user_request: The user's request
         
     Returns:
-        List of subtasks
+        Tuple containing (request_category, enhanced_prompt)
     """
-    logging.info("Generating plan with Azure OpenAI")
-    
     # 1. Determine request category and domain specialization
     request_category = classify_request(user_request)
     domain_info = detect_domain_specialization(user_request)
@@ -42,6 +41,23 @@ def generate_plan(user_request: str) -> List[str]:
         request_category,
         domain_info
     )
+    return request_category, enhanced_prompt
+
+
+def generate_plan(user_request: str) -> Sequence[str]:
+    """
+    Generate a plan using Azure OpenAI.
+    
+    Args:
+        user_request: The user's request
+        
+    Returns:
+        Sequence of subtasks (the shared fallback tuple if no plan could be extracted)
+    """
+    logging.info("Generating plan with Azure OpenAI")
+    
+    # 1-2. Classify the request and build the domain-enhanced planner prompt
+    request_category, enhanced_prompt = build_plan_prompt(user_request)
     
     # 3. Call Azure OpenAI to generate the plan
     plan_text = call_azure_openai(settings.MODEL_PLANNER, enhanced_prompt)
@@ -51,7 +67,7 @@ def generate_plan(user_request: str) -> List[str]:
     
     # 5. Provide fallback if extraction failed
     if not subtasks:
-        logging.warning(f"Failed to extract subtasks from plan text: {plan_text}")
+        logging.warning("Failed to extract subtasks from plan text: %s", plan_text)
         # Use appropriate fallback based on request category
         return get_fallback_plan(request_category)
         
@@ -61,58 +77,262 @@ def generate_plan(user_request: str) -> List[str]:
 # ----------------------------------------
 #  STEP 2: EXECUTE SUBTASKS
 # ----------------------------------------
-def execute_subtasks(subtasks: List[str], user_request: str) -> List[Dict[str, str]]:
+# Marker ending each answer in a grouped subtask response
+SUBTASK_ANSWER_DELIMITER = "<<<END>>>"
+
+
+def build_subtask_prompt(task: str, user_request: str, request_category: str,
+                         domain_info: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the domain-enhanced executor prompt for a subtask.
+    
+    Args:
+        task: The subtask description
+        user_request: The original user request for domain context
+        request_category: The classified request category
+        domain_info: Domain specialization information
+        
+    Returns:
+        Tuple containing (subtask_type, enhanced_prompt)
+    """
+    # 1. Detect subtask type for better prompt engineering
+    subtask_type = classify_subtask(task, domain_info)
+    
+    # 2. Enhance executor prompt with domain knowledge and subtask type
+    executor_prompt = settings.EXECUTOR_TEMPLATE.format(subtask=task)
+    enhanced_prompt = enhance_subtask_prompt(
+        executor_prompt, 
+        user_request, 
+        task, 
+        request_category,
+        domain_info,
+    )
+    return subtask_type, enhanced_prompt
+
+
+def execute_subtasks(subtasks: List[str], user_request: str,
+                     max_workers: Optional[int] = None,
+                     group_size: Optional[int] = None) -> List[Dict[str, str]]:
     """
     Execute all subtasks using Azure OpenAI.
     
+    Subtasks are independent API calls, so they run concurrently on a bounded
+    thread pool. Results keep subtask order. Transient API failures are retried
+    with exponential backoff by the client (MAX_RETRIES).
+    
+    With group_size > 1, consecutive subtasks share one chat completion whose
+    answers are split on SUBTASK_ANSWER_DELIMITER, saving round trips. A
+    group_size of 0 sends the whole plan in a single call.
+    
     Args:
         subtasks: List of subtask descriptions
         user_request: The original user request for domain context
+        max_workers: Maximum concurrent calls (defaults to settings.MAX_CONCURRENT_SUBTASKS)
+        group_size: Subtasks answered per call, 0 for all (defaults to settings.SUBTASK_GROUP_SIZE)
         
     Returns:
         List of dictionaries with subtask descriptions and results
     """
-    results = []
-    logging.info(f"Executing {len(subtasks)} subtasks")
+    logging.info("Executing %d subtasks", len(subtasks))
     
     # 1. Pre-classify request and detect domain for consistent handling
     request_category = classify_request(user_request)
     domain_info = detect_domain_specialization(user_request)
     
-    for i, task in enumerate(subtasks, 1):
-        logging.info(f"Executing subtask {i}/{len(subtasks)}: {task[:30]}...")
+    if max_workers is None:
+        max_workers = settings.MAX_CONCURRENT_SUBTASKS
+    if group_size is None:
+        group_size = settings.SUBTASK_GROUP_SIZE
+    if group_size == 0:
+        group_size = len(subtasks)
+    
+    if group_size > 1 and len(subtasks) > 1:
+        # 2a. Execute groups of subtasks concurrently, one call per group
+        indexed = list(enumerate(subtasks, 1))
+        groups = [indexed[start:start + group_size] for start in range(0, len(indexed), group_size)]
         
-        # 2. Detect subtask type for better prompt engineering
-        subtask_type = classify_subtask(task, domain_info)
+        def run_group(group: List[Tuple[int, str]]) -> List[Dict[str, str]]:
+            return _execute_subtask_group(group, len(subtasks), user_request, request_category, domain_info)
         
-        # 3. Enhance executor prompt with domain knowledge and subtask type
-        executor_prompt = settings.EXECUTOR_TEMPLATE.format(subtask=task)
-        enhanced_prompt = enhance_subtask_prompt(
-            executor_prompt, 
-            user_request, 
-            task, 
-            request_category,
-            domain_info,
-        )
+        workers = max(1, min(max_workers, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [result for results in executor.map(run_group, groups) for result in results]
+    
+    def run(indexed_task: Tuple[int, str]) -> Dict[str, str]:
+        i, task = indexed_task
+        return _execute_subtask(i, len(subtasks), task, user_request, request_category, domain_info)
+    
+    # 2. Execute subtasks concurrently; map() yields results in submission order
+    workers = max(1, min(max_workers, len(subtasks)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, enumerate(subtasks, 1)))
+
+
+def build_grouped_subtask_prompt(prompts: List[str]) -> str:
+    """
+    Combine several executor prompts into one prompt answered in a single call.
+    
+    Args:
+        prompts: The enhanced executor prompts, in subtask order
         
-        # 4. Call Azure OpenAI to execute the subtask
-        try:
-            result_text = call_azure_openai(settings.MODEL_EXECUTOR, enhanced_prompt)
-            
-            # 5. Store the result
-            results.append({
-                "task": task,
-                "result": result_text,
-                "type": subtask_type
-            })
-            
-            logging.info(f"Completed subtask {i}/{len(subtasks)}")
-        except Exception as e:
-            logging.error(f"Error executing subtask {i}: {str(e)}")
-            results.append({
-                "task": task,
-                "result": f"Error: {str(e)}",
-                "type": subtask_type
-            })
-    
-    return results
\ No newline at end of file
+    Returns:
+        Prompt asking for every answer, each ended by SUBTASK_ANSWER_DELIMITER
+    """
+    tasks = "\n\n".join(f"### Task {i}\n{prompt}" for i, prompt in enumerate(prompts, 1))
+    return settings.GROUPED_EXECUTOR_TEMPLATE.format(
+        count=len(prompts),
+        delimiter=SUBTASK_ANSWER_DELIMITER,
+        tasks=tasks
+    )
+
+
+def split_grouped_response(response_text: str, count: int) -> Optional[List[str]]:
+    """
+    Split a grouped completion into its individual answers.
+    
+    Args:
+        response_text: The completion for a grouped subtask prompt
+        count: The number of answers expected
+        
+    Returns:
+        List of answers in order, or None if the response does not hold exactly count answers
+    """
+    answers = [answer.strip() for answer in response_text.split(SUBTASK_ANSWER_DELIMITER)]
+    # Text after the last delimiter is only whitespace in a well-formed response
+    if answers and not answers[-1]:
+        answers.pop()
+    if len(answers) != count or not all(answers):
+        return None
+    return answers
+
+
+def generate_plan_and_execute_streaming(user_request: str, max_workers: Optional[int] = None
+                                        ) -> Tuple[List[str], List[Dict[str, str]]]:
+    """
+    Stream the plan and start executing each subtask as soon as its line arrives.
+    
+    Plan generation and subtask execution overlap, so the first subtasks are
+    already running while the planner is still writing the rest of the plan.
+    
+    Args:
+        user_request: The user's request
+        max_workers: Maximum concurrent calls (defaults to settings.MAX_CONCURRENT_SUBTASKS)
+        
+    Returns:
+        Tuple containing (subtasks, results)
+    """
+    logging.info("Generating plan with Azure OpenAI (streaming)")
+    
+    # 1. Classify the request and build the domain-enhanced planner prompt
+    request_category, enhanced_prompt = build_plan_prompt(user_request)
+    domain_info = detect_domain_specialization(user_request)
+    
+    # 2. Submit each subtask as soon as the plan stream completes its line
+    subtasks: List[str] = []
+    futures = []
+    workers = max(1, max_workers if max_workers is not None else settings.MAX_CONCURRENT_SUBTASKS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        plan_chunks = stream_azure_openai(settings.MODEL_PLANNER, enhanced_prompt)
+        for task in iter_subtasks_from_chunks(plan_chunks):
+            subtasks.append(task)
+            futures.append(executor.submit(
+                _execute_subtask, len(subtasks), None, task, user_request, request_category, domain_info
+            ))
+        results = [future.result() for future in futures]
+    
+    # 3. Provide fallback if no subtasks were streamed
+    if not subtasks:
+        logging.warning("Failed to extract subtasks from streamed plan, using fallback")
+        subtasks = get_fallback_plan(request_category)
+        results = execute_subtasks(subtasks, user_request, max_workers)
+    
+    return subtasks, results
+
+
+def _execute_subtask(i: int, total: Optional[int], task: str, user_request: str,
+                     request_category: str, domain_info: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Execute a single subtask using Azure OpenAI.
+    
+    Args:
+        i: The 1-based position of the subtask
+        total: The total number of subtasks, or None while the plan is still streaming
+        task: The subtask description
+        user_request: The original user request for domain context
+        request_category: The classified request category
+        domain_info: Domain specialization information
+        
+    Returns:
+        Dictionary with the subtask description, result and type
+    """
+    logging.info("Executing subtask %d/%s: %.30s...", i, total or "?", task)
+    
+    # 1-2. Classify the subtask and build its domain-enhanced prompt
+    subtask_type, enhanced_prompt = build_subtask_prompt(task, user_request, request_category, domain_info)
+    
+    # 3. Call Azure OpenAI to execute the subtask
+    try:
+        result_text = call_azure_openai(settings.MODEL_EXECUTOR, enhanced_prompt)
+        logging.info("Completed subtask %d/%s", i, total or "?")
+        return {
+            "task": task,
+            "result": result_text,
+            "type": subtask_type
+        }
+    except Exception as e:
+        logging.error("Error executing subtask %d: %s", i, e)
+        return {
+            "task": task,
+            "result": f"Error: {str(e)}",
+            "type": subtask_type
+        }
+
+
+def _execute_subtask_group(group: List[Tuple[int, str]], total: int, user_request: str,
+                           request_category: str, domain_info: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    Execute several subtasks with a single Azure OpenAI call.
+    
+    If the grouped response cannot be split into one answer per subtask, each
+    subtask of the group is executed on its own instead.
+    
+    Args:
+        group: The (1-based position, subtask description) pairs to execute
+        total: The total number of subtasks
+        user_request: The original user request for domain context
+        request_category: The classified request category
+        domain_info: Domain specialization information
+        
+    Returns:
+        List of dictionaries with the subtask description, result and type, in group order
+    """
+    if len(group) == 1:
+        i, task = group[0]
+        return [_execute_subtask(i, total, task, user_request, request_category, domain_info)]
+    
+    logging.info("Executing subtasks %d-%d/%d in one call", group[0][0], group[-1][0], total)
+    
+    # 1. Build every subtask prompt and combine them
+    built = [build_subtask_prompt(task, user_request, request_category, domain_info) for _, task in group]
+    grouped_prompt = build_grouped_subtask_prompt([prompt for _, prompt in built])
+    
+    # 2. Call Azure OpenAI once and split the answers
+    answers = None
+    try:
+        response_text = call_azure_openai(settings.MODEL_EXECUTOR, grouped_prompt)
+        if not response_text.startswith("Error:"):
+            answers = split_grouped_response(response_text, len(group))
+    except Exception as e:
+        logging.error("Error executing subtasks %d-%d: %s", group[0][0], group[-1][0], e)
+    
+    # 3. Fall back to one call per subtask when the answers could not be split
+    if answers is None:
+        logging.warning("Could not split grouped response for subtasks %d-%d, executing individually",
+                        group[0][0], group[-1][0])
+        return [_execute_subtask(i, total, task, user_request, request_category, domain_info)
+                for i, task in group]
+    
+    return [
+        {"task": task, "result": answer, "type": subtask_type}
+        for (_, task), (subtask_type, _), answer in zip(group, built, answers)
+    ]
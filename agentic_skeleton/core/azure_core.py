@@ -9,8 +9,11 @@ for generating plans and executing tasks. Used in production mode.
 import logging
 from typing import Dict, List, Tuple, Any
 
+from agentic_skeleton.config import settings
 from agentic_skeleton.core.azure.generator import generate_plan as _generate_plan, execute_subtasks as _execute_subtasks
+from agentic_skeleton.core.azure.generator import generate_plan_and_execute_streaming
 from agentic_skeleton.core.azure.constants.fallback_plans import get_fallback_plan as _get_fallback_plan
+from agentic_skeleton.core.azure.cache import semantic_cache
 
 # Re-export functions needed by tests
 generate_plan = _generate_plan
@@ -29,10 +32,25 @@ def generate_azure_plan_and_results(user_request: str) -> Tuple[List[str], List[
     """
     logging.info("Starting Azure OpenAI plan generation and execution")
     
-    # Generate the plan using the modular generator
-    subtasks = generate_plan(user_request)
+    # Reuse the plan and results of a near-identical earlier request
+    if semantic_cache.enabled:
+        cached = semantic_cache.lookup(user_request)
+        if cached is not None:
+            logging.info("Serving plan and results from semantic cache")
+            return cached
     
-    # Execute each subtask using the modular executor
-    results = execute_subtasks(subtasks, user_request)
+    if settings.STREAM_PLAN_EXECUTION:
+        # Overlap plan streaming with subtask execution
+        subtasks, results = generate_plan_and_execute_streaming(user_request)
+    else:
+        # Generate the plan using the modular generator
+        subtasks = generate_plan(user_request)
+        
+        # Execute each subtask using the modular executor
+        results = execute_subtasks(subtasks, user_request)
+    
+    # Only cache runs where every subtask succeeded
+    if semantic_cache.enabled and not any(r["result"].startswith("Error:") for r in results):
+        semantic_cache.add(user_request, (subtasks, results))
     
     return subtasks, results
\ No newline at end of file
@@ -6,8 +6,31 @@ Classifies user requests into predefined categories for the mock response genera
 """
 
 import logging
+import re
+import sys
 from typing import List, Dict, Tuple, Any
 from agentic_skeleton.core.mock.constants import REQUEST_CLASSIFIERS, COMPLEX_TASK_INDICATORS, GENERIC_SUBTASK_PATTERNS
+from agentic_skeleton.core.mock.constants.domain_knowledge import DOMAIN_KNOWLEDGE
+
+# Domain keywords normalized once at import: (domain name, domain data, lowercased keywords).
+# Keywords are interned so every matched-keyword list and topic shares one string object each.
+_DOMAIN_KEYWORD_INDEX = tuple(
+    (domain_name, domain_data, tuple(sys.intern(kw.lower().strip()) for kw in domain_data.get("keywords", []) if kw))
+    for domain_name, domain_data in DOMAIN_KNOWLEDGE.items()
+)
+
+# Single alternation over every domain keyword, used to reject requests that match no domain
+_ANY_DOMAIN_KEYWORD_RE = re.compile("|".join(
+    re.escape(kw) for _, _, keywords in _DOMAIN_KEYWORD_INDEX for kw in keywords
+))
+
+# Request patterns compiled to one regex per plan type, so plan types the request
+# does not mention are skipped before their patterns are counted
+_REQUEST_CLASSIFIER_RES = tuple(
+    (classifier["type"], classifier["patterns"],
+     re.compile("|".join(re.escape(pattern) for pattern in classifier["patterns"]) or "(?!)"))
+    for classifier in REQUEST_CLASSIFIERS
+)
 
 def classify_request(user_request: str) -> str:
     """
@@ -24,27 +47,30 @@ def classify_request(user_request: str) -> str:
     # 1. Detect explicit complex multi-domain phrases
     explicit_complex_task = (
         any(term in request_lower for term in COMPLEX_TASK_INDICATORS) and 
-        len(request_lower.split()) > 15
+        # maxsplit stops after the 16th word: only "more than 15" matters
+        len(request_lower.split(None, 15)) > 15
     )
     
     # 2. Check for multiple domain matches (implicit complex task)
     domain_matches = []
-    for classifier in REQUEST_CLASSIFIERS:
-        matches = sum(1 for pattern in classifier["patterns"] if pattern in request_lower)
-        if matches > 0:
-            domain_matches.append((classifier["type"], matches))
+    for plan_type, patterns, regex in _REQUEST_CLASSIFIER_RES:
+        if regex.search(request_lower):
+            # Score is the number of distinct patterns present, overlaps included
+            matches = sum(1 for pattern in patterns if pattern in request_lower)
+            domain_matches.append((plan_type, matches))
     
     # Consider it complex if we match more than one domain type
     implicit_complex_task = len(domain_matches) > 1
     
     # 3. Handle complex tasks
     if explicit_complex_task or implicit_complex_task:
-        logging.info(f"Complex task detected - domains: {[d[0] for d in domain_matches]}")
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("Complex task detected - domains: %s", [d[0] for d in domain_matches])
         
         # Use the most dominant theme or data-science as fallback
         if domain_matches:
             dominant_type = max(domain_matches, key=lambda x: x[1])[0]
-            logging.info(f"Using dominant classification: {dominant_type}")
+            logging.info("Using dominant classification: %s", dominant_type)
             return dominant_type
         else:
             return "data-science"
@@ -52,11 +78,11 @@ def classify_request(user_request: str) -> str:
     # 4. Handle simple tasks with a single domain
     if domain_matches:
         plan_type = domain_matches[0][0]
-        logging.info(f"Request classified as: {plan_type}")
+        logging.info("Request classified as: %s", plan_type)
         return plan_type
     
     # 5. Default classification if no patterns match
-    logging.info(f"No specific patterns matched, using default classification")
+    logging.info("No specific patterns matched, using default classification")
     return "default"
 
 def detect_domain_specialization(user_request: str) -> Dict[str, Any]:
@@ -69,14 +95,17 @@ def detect_domain_specialization(user_request: str) -> Dict[str, Any]:
     Returns:
         Dictionary with domain specialization information
     """
-    from agentic_skeleton.core.mock.constants.domain_knowledge import DOMAIN_KNOWLEDGE
-    
     request_lower = user_request.lower()
+    
+    # Most requests match no domain; a single regex scan rules them out
+    if not _ANY_DOMAIN_KEYWORD_RE.search(request_lower):
+        return {}
+    
     domain_matches = []
     
     # Check each domain for keyword matches
-    for domain_name, domain_data in DOMAIN_KNOWLEDGE.items():
-        matches = [kw for kw in domain_data["keywords"] if kw in request_lower]
+    for domain_name, domain_data, domain_keywords in _DOMAIN_KEYWORD_INDEX:
+        matches = [kw for kw in domain_keywords if kw in request_lower]
         if matches:
             domain_matches.append({
                 "domain": domain_name,
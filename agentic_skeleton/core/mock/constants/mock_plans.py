@@ -9,47 +9,48 @@ Used by the mock response generator.
 # ----------------------------------------
 #  MOCK PLANS
 # ----------------------------------------
+# Plans are tuples: the generator returns them to every caller without copying
 MOCK_PLANS = {
-    "write": [
+    "write": (
         "Research recent (2024-2025) sources and identify 3-5 key insights on the topic",
         "Develop a structured outline with main arguments and supporting evidence",
         "Write a first draft with compelling introduction, evidence-backed body sections, and actionable conclusion",
         "Edit for clarity, flow, and conciseness (aim for 15-20% word reduction)",
         "Format with proper headings, citations, and visual elements if applicable"
-    ],
-    "analyze": [
+    ),
+    "analyze": (
         "Collect comprehensive data from primary sources and organize into structured format",
         "Identify 3-5 key patterns, trends, or anomalies in the dataset",
         "Compare findings with industry benchmarks or historical performance metrics",
         "Generate actionable insights and recommendations based on analysis",
         "Create visualization dashboard with key metrics and supporting evidence"
-    ],
-    "develop": [
+    ),
+    "develop": (
         "Define technical requirements and architecture based on user needs and performance criteria",
         "Design system components with clean interfaces, data models, and API specifications",
         "Implement core functionality with appropriate error handling and security practices",
         "Create automated test suite covering critical paths and edge cases",
         "Deploy solution with monitoring, documentation, and maintenance plan"
-    ],
-    "design": [
+    ),
+    "design": (
         "Research user needs, behaviors, and competitive landscape for the product",
         "Create information architecture and user flow diagrams for key journeys",
         "Develop wireframes and interactive prototypes for critical screens",
         "Design comprehensive UI components with accessibility and responsive considerations",
         "Create design system documentation with implementation guidelines"
-    ],
-    "data-science": [
+    ),
+    "data-science": (
         "Collect and preprocess data from relevant sources with quality assessment",
         "Perform exploratory data analysis to identify patterns and potential features",
         "Develop and train multiple models with cross-validation and hyperparameter tuning",
         "Evaluate model performance with appropriate metrics and business impact assessment",
         "Create deployable solution with monitoring for data and prediction drift"
-    ],
-    "default": [
+    ),
+    "default": (
         "Research the topic thoroughly and identify 3-5 key points",
         "Create a structured outline with logical flow",
         "Develop initial draft with comprehensive content",
         "Revise and optimize for clarity and effectiveness",
         "Finalize with proper formatting and quality assurance"
-    ]
+    )
 }
\ No newline at end of file
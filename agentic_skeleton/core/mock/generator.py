@@ -8,12 +8,70 @@ Generates mock responses for tasks based on the request classification and domai
 import random
 import re
 import logging
-from typing import Dict, List, Any, Optional, Tuple, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 
 from agentic_skeleton.core.mock.constants.mock_responses import MOCK_RESPONSES
 from agentic_skeleton.core.mock.constants.mock_plans import MOCK_PLANS
-from agentic_skeleton.core.mock.constants.domain_knowledge import DOMAIN_KNOWLEDGE
 from agentic_skeleton.core.mock.classifier import classify_request, classify_subtask
+# Shared with the classifier so domain keywords are normalized in a single pass at import.
+# Keyword order is preserved so the first matching keyword still becomes the topic.
+from agentic_skeleton.core.mock.classifier import _DOMAIN_KEYWORD_INDEX
+
+
+# General verb categories used when a domain matches but none of its subtask patterns do.
+# Read-only view so the shared table cannot be mutated by callers.
+_GENERAL_VERBS = MappingProxyType({
+    "research": ("research", "analyze", "study", "evaluate", "assess", "compare", "investigate"),
+    "implement": ("implement", "build", "create", "develop", "deploy", "construct", "integrate"),
+    "design": ("design", "architect", "plan", "blueprint", "outline", "sketch", "wireframe"),
+    "optimize": ("optimize", "improve", "enhance", "refine", "tune", "streamline", "refactor"),
+    "evaluate": ("evaluate", "test", "verify", "validate", "measure", "assess"),
+    "model": ("model", "train", "learn", "predict"),
+    "data": ("data", "dataset", "preprocess", "clean", "prepare")
+})
+
+# Stopwords for filtering topic candidates
+_TOPIC_STOPWORDS = frozenset([
+    'with', 'from', 'then', 'than', 'that', 'this', 'these', 'those',
+    'the', 'and', 'but', 'for', 'yet', 'so', 'or', 'nor', 'as', 'at',
+    'by', 'in', 'to', 'is', 'on', 'been', 'was', 'were', 'of'
+])
+
+# Question and filler words skipped when picking a topic from the request text
+_REQUEST_TOPIC_STOPWORDS = frozenset(["about", "with", "that", "what", "when", "where", "which", "how"])
+
+# Filler words skipped when picking a topic for a fallback task response
+_TASK_TOPIC_STOPWORDS = frozenset(["with", "from", "then", "than", "that", "this"])
+
+# Maps every ASCII non-word character to a space so str.split() yields \w+ runs
+_NON_WORD_TO_SPACE = str.maketrans({
+    chr(code): " " for code in range(128) if not (chr(code).isalnum() or chr(code) == "_")
+})
+_TOPIC_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+
+@lru_cache(maxsize=1024)
+def _extract_topic_words(text: str) -> Tuple[str, ...]:
+    """
+    Extract lowercased words of four or more ASCII letters from text.
+    
+    Mock plans reuse a fixed set of subtasks, so results are memoized per text.
+    
+    Args:
+        text: The text to tokenize
+        
+    Returns:
+        Tuple of candidate topic words in order of appearance
+    """
+    # Non-ASCII text keeps the regex path for exact word-boundary semantics
+    if not text.isascii():
+        return tuple(word.lower() for word in _TOPIC_WORD_RE.findall(text))
+    
+    # Lowercase the whole text once; for ASCII this cannot move word boundaries
+    return tuple(word for word in text.lower().translate(_NON_WORD_TO_SPACE).split()
+                 if len(word) >= 4 and word.isalpha())
 
 
 class MockResponseGenerator:
@@ -21,6 +79,9 @@ class MockResponseGenerator:
     Generates simulated responses for different types of requests.
     """
     
+    # Created per call by generate_mock_response; slots avoid a per-instance __dict__
+    __slots__ = ("mock_responses",)
+    
     def __init__(self):
         """Initialize the mock response generator."""
         self.mock_responses = MOCK_RESPONSES
@@ -41,8 +102,7 @@ class MockResponseGenerator:
             # Simple extraction - in production would use NLP to better extract topics
             words = user_request.split()
             # Extract potential topic phrases (nouns and noun phrases)
-            topic_candidates = [w for w in words if len(w) > 3 and w.lower() not in 
-                              ["about", "with", "that", "what", "when", "where", "which", "how"]]
+            topic_candidates = [w for w in words if len(w) > 3 and w.lower() not in _REQUEST_TOPIC_STOPWORDS]
             
             if topic_candidates:
                 # Use the last longer phrase as topic (heuristic)
@@ -103,7 +163,7 @@ def generate_mock_response(user_request: str, topic: Optional[str] = None) -> st
     return generator.get_mock_response(user_request, topic)
 
 
-def generate_mock_plan_and_results(user_request: str) -> Tuple[List[str], List[Dict]]:
+def generate_mock_plan_and_results(user_request: str) -> Tuple[Sequence[str], List[Dict]]:
     """
     Generate a mock plan and results for a user request.
     
@@ -113,6 +173,8 @@ def generate_mock_plan_and_results(user_request: str) -> Tuple[List[str], List[D
     Returns:
         Tuple containing (subtasks, results)
     """
+    logging.info("Starting mock plan generation and execution")
+    
     # Get appropriate plan based on request classification
     plan_type = classify_request(user_request)
     subtasks = MOCK_PLANS[plan_type]
@@ -123,11 +185,11 @@ def generate_mock_plan_and_results(user_request: str) -> Tuple[List[str], List[D
         # Get a dynamic response for this task
         response = get_mock_task_response(task)
         
-        # Ensure we never have empty responses
-        if not response or not response.strip() or "[MOCK]" not in response:
+        # Ensure we never have empty responses ("[MOCK]" present implies non-blank)
+        if not response or "[MOCK]" not in response:
             # Generate a fallback response with task text embedded
             words = task.lower().split()
-            topic = next((w for w in words if len(w) > 4 and w not in ["with", "from", "then", "than", "that", "this"]), "task")
+            topic = next((w for w in words if len(w) > 4 and w not in _TASK_TOPIC_STOPWORDS), "task")
             
             templates = MOCK_RESPONSES["default"]
             response = random.choice(templates).format(topic=topic)
@@ -155,14 +217,12 @@ def get_mock_task_response(task: str) -> str:
     template_category = None
     
     # 1. Domain-specific response
-    for domain_name, domain_data in DOMAIN_KNOWLEDGE.items():
-        domain_match = any(keyword in task_lower for keyword in domain_data["keywords"])
+    for domain_name, domain_data, domain_keywords in _DOMAIN_KEYWORD_INDEX:
+        # Single pass: the first matching keyword both detects the domain and becomes the topic
+        matching_keyword = next((kw for kw in domain_keywords if kw in task_lower), None)
         
         # Specific topic extraction for domain matching
-        if domain_match:
-            # Extract the matching keyword to use as the topic
-            matching_keyword = next((kw for kw in domain_data["keywords"] if kw in task_lower), domain_data["keywords"][0])
-            
+        if matching_keyword is not None:
             # Match subtask patterns
             for subtask_type, subtask_data in domain_data["subtasks"].items():
                 subtask_match = any(pattern in task_lower for pattern in subtask_data["patterns"])
@@ -174,18 +234,7 @@ def get_mock_task_response(task: str) -> str:
             
             # If no specific subtask pattern matched but domain matched, 
             # find a suitable subtask pattern based on general terms in the task
-            general_verbs = {
-                "research": ["research", "analyze", "study", "evaluate", "assess", "compare", "investigate"],
-                "implement": ["implement", "build", "create", "develop", "deploy", "construct", "integrate"],
-                "design": ["design", "architect", "plan", "blueprint", "outline", "sketch", "wireframe"],
-                "optimize": ["optimize", "improve", "enhance", "refine", "tune", "streamline", "refactor"],
-                "evaluate": ["evaluate", "test", "verify", "validate", "measure", "assess"],
-                "model": ["model", "train", "learn", "predict"],
-                "data": ["data", "dataset", "preprocess", "clean", "prepare"]
-            }
-            
-            # Find a matching general verb category
-            for verb_category, verb_list in general_verbs.items():
+            for verb_category, verb_list in _GENERAL_VERBS.items():
                 if any(verb in task_lower for verb in verb_list):
                     # See if this domain has this verb category
                     if verb_category in domain_data["subtasks"]:
@@ -281,16 +330,8 @@ def get_mock_task_response(task: str) -> str:
     
     # Extract topic if not already determined
     if not topic:
-        # Stopwords for filtering
-        stopwords = [
-            'with', 'from', 'then', 'than', 'that', 'this', 'these', 'those',
-            'the', 'and', 'but', 'for', 'yet', 'so', 'or', 'nor', 'as', 'at',
-            'by', 'for', 'in', 'to', 'is', 'on', 'been', 'was', 'were', 'of'
-        ]
-        
         # Get significant words from the task
-        words = [word.lower() for word in re.findall(r'\b[a-zA-Z]{4,}\b', task) 
-                if word.lower() not in stopwords]
+        words = [word for word in _extract_topic_words(task) if word not in _TOPIC_STOPWORDS]
         
         # Use the most significant word as topic (simple heuristic)
         topic = words[-1] if words else "task"
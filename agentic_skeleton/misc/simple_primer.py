@@ -14,6 +14,7 @@ Environment Variables:
 """
 
 import os
+import json
 from flask import Flask, request, jsonify
 from dotenv import load_dotenv
 
@@ -40,6 +41,24 @@ EXECUTOR_TEMPLATE = (
     "Subtask: {subtask}"
 )
 
+BATCH_EXECUTOR_TEMPLATE = (
+    "You are an execution assistant.\n"
+    "Perform each of the subtasks below. Respond with just a JSON array of\n"
+    "objects with \"id\" and \"result\" keys, one per subtask:\n\n"
+    "{subtasks}"
+)
+
+# Maximum subtasks sent in a single batched executor call
+MAX_BATCH_SIZE = 20
+
+# Maximum requests accepted by a single /run-agent-batch call (same limit as the main API)
+MAX_BATCH_REQUESTS = 20
+
+# Templates split once around their single field so building a prompt is plain concatenation
+_PLANNER_PRE, _PLANNER_POST = PLANNER_TEMPLATE.split("{user_request}")
+_EXECUTOR_PRE, _EXECUTOR_POST = EXECUTOR_TEMPLATE.split("{subtask}")
+_BATCH_EXECUTOR_PRE, _BATCH_EXECUTOR_POST = BATCH_EXECUTOR_TEMPLATE.split("{subtasks}")
+
 # Mock data
 MOCK_TASKS = [
     "Research the topic thoroughly",
@@ -87,6 +106,18 @@ def get_mock_response(task):
     
     return template.format(topic=topic)
 
+def planner_prompt(user_request):
+    """Build the planner prompt for a user request"""
+    return _PLANNER_PRE + user_request + _PLANNER_POST
+
+def executor_prompt(subtask):
+    """Build the executor prompt for a single subtask"""
+    return _EXECUTOR_PRE + subtask + _EXECUTOR_POST
+
+def batch_executor_prompt(subtasks_json):
+    """Build the batched executor prompt for a JSON list of subtasks"""
+    return _BATCH_EXECUTOR_PRE + subtasks_json + _BATCH_EXECUTOR_POST
+
 def call_azure_openai(model, prompt):
     """Call Azure OpenAI API"""
     try:
@@ -99,6 +130,37 @@ def call_azure_openai(model, prompt):
     except Exception as e:
         return f"Error: {str(e)}"
 
+def parse_batch_results(response_text):
+    """Parse a batched executor response into a dict of id -> result"""
+    text = response_text.strip()
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json")
+    try:
+        return {item["id"]: str(item["result"]) for item in json.loads(text)}
+    except (ValueError, TypeError, KeyError):
+        return {}
+
+def execute_subtasks_batched(subtasks):
+    """Execute subtasks with one Azure call per batch instead of one per subtask"""
+    results = []
+    for start in range(0, len(subtasks), MAX_BATCH_SIZE):
+        batch = subtasks[start:start + MAX_BATCH_SIZE]
+        batch_prompt = batch_executor_prompt(
+            json.dumps([{"id": i, "subtask": task} for i, task in enumerate(batch)])
+        )
+        batch_results = parse_batch_results(call_azure_openai("gpt-4", batch_prompt))
+        
+        for i, task in enumerate(batch):
+            result = batch_results.get(i)
+            if result is None:
+                # Missing or unparseable entry: execute this subtask on its own
+                result = call_azure_openai("gpt-4", executor_prompt(task))
+            results.append({
+                "subtask": task,
+                "result": result
+            })
+    return results
+
 # API Endpoints
 @app.route("/health", methods=["GET"])
 def health_check():
@@ -109,6 +171,36 @@ def health_check():
         "version": "1.0.0"
     })
 
+def process_request(user_request):
+    """Generate the plan and results for a user request, or None if no plan was produced"""
+    if USE_MOCK:
+        # Use mock data in development mode
+        subtasks = MOCK_TASKS
+        results = []
+        for task in subtasks:
+            results.append({
+                "subtask": task,
+                "result": get_mock_response(task)
+            })
+        return subtasks, results
+    
+    # Use Azure OpenAI in production mode
+    # Step 1: Generate a plan
+    plan_text = call_azure_openai("gpt-4", planner_prompt(user_request))
+    
+    # Step 2: Extract subtasks from the response
+    subtasks = [
+        line.partition(" ")[2].strip()
+        for line in plan_text.splitlines()
+        if line and line[0].isdigit()
+    ]
+    
+    if not subtasks:
+        return None
+    
+    # Step 3: Execute the subtasks in batched calls
+    return subtasks, execute_subtasks_batched(subtasks)
+
 @app.route("/run-agent", methods=["POST"])
 def run_agent():
     """Main agent endpoint"""
@@ -120,44 +212,12 @@ def run_agent():
                 "error": "Missing required field: 'request'"
             }), 400
 
-        user_request = payload["request"]
-        
-        if USE_MOCK:
-            # Use mock data in development mode
-            subtasks = MOCK_TASKS
-            results = []
-            for task in subtasks:
-                results.append({
-                    "subtask": task,
-                    "result": get_mock_response(task)
-                })
-        else:
-            # Use Azure OpenAI in production mode
-            # Step 1: Generate a plan
-            planner_prompt = PLANNER_TEMPLATE.format(user_request=user_request)
-            plan_text = call_azure_openai("gpt-4", planner_prompt)
-            
-            # Step 2: Extract subtasks from the response
-            subtasks = [
-                line.partition(" ")[2].strip()
-                for line in plan_text.splitlines()
-                if line and line[0].isdigit()
-            ]
-            
-            if not subtasks:
-                return jsonify({
-                    "error": "Failed to generate a plan with subtasks"
-                }), 500
-            
-            # Step 3: Execute each subtask
-            results = []
-            for task in subtasks:
-                executor_prompt = EXECUTOR_TEMPLATE.format(subtask=task)
-                result = call_azure_openai("gpt-4", executor_prompt)
-                results.append({
-                    "subtask": task,
-                    "result": result
-                })
+        outcome = process_request(payload["request"])
+        if outcome is None:
+            return jsonify({
+                "error": "Failed to generate a plan with subtasks"
+            }), 500
+        subtasks, results = outcome
         
         # Return the plan and results
         return jsonify({
@@ -171,12 +231,44 @@ def run_agent():
             "message": str(e)
         }), 500
 
+@app.route("/run-agent-batch", methods=["POST"])
+def run_agent_batch():
+    """Batch agent endpoint: one plan/results entry per request, in order"""
+    try:
+        payload = request.get_json()
+        user_requests = payload.get("requests") if isinstance(payload, dict) else None
+        if not isinstance(user_requests, list) or not all(isinstance(r, str) for r in user_requests):
+            return jsonify({
+                "error": "Missing required field: 'requests' (list of strings)"
+            }), 400
+        if len(user_requests) > MAX_BATCH_REQUESTS:
+            return jsonify({
+                "error": f"Too many requests in batch (maximum {MAX_BATCH_REQUESTS})"
+            }), 400
+        
+        responses = []
+        for user_request in user_requests:
+            outcome = process_request(user_request)
+            if outcome is None:
+                responses.append({"error": "Failed to generate a plan with subtasks"})
+            else:
+                responses.append({"plan": outcome[0], "results": outcome[1]})
+        
+        return jsonify({"responses": responses})
+        
+    except Exception as e:
+        return jsonify({
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
 # Main entry point
 def main():
     """Run the Flask application"""
     print(f"Starting AgenticSkeleton in {'mock' if USE_MOCK else 'Azure'} mode")
     print(f"Health endpoint: http://localhost:{PORT}/health")
     print(f"Agent endpoint: http://localhost:{PORT}/run-agent")
+    print(f"Batch endpoint: http://localhost:{PORT}/run-agent-batch")
     app.run(host="0.0.0.0", port=PORT)
 
 if __name__ == "__main__":
@@ -10,11 +10,18 @@ Use this as a starting point for testing your AI agent implementation.
 """
 
 import requests
+import argparse
 import json
 import os
+import statistics
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+from agentic_skeleton.utils.http_client import (
+    SESSION, JSON_HEADERS, HEALTH_TIMEOUT, AGENT_TIMEOUT, json_body
+)
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -22,6 +29,10 @@ load_dotenv()
 BASE_URL = f"http://localhost:{os.getenv('PORT', '8000')}"
 HEALTH_ENDPOINT = f"{BASE_URL}/health"
 AGENT_ENDPOINT = f"{BASE_URL}/run-agent"
+BATCH_ENDPOINT = f"{BASE_URL}/run-agent-batch"
+
+# Maximum number of queries in flight at once when sending them individually
+TEST_CONCURRENCY = int(os.getenv("TEST_CONCURRENCY", "4"))
 
 # Test queries
 TEST_QUERIES = [
@@ -36,7 +47,7 @@ def test_health():
     print("-" * 40)
     
     try:
-        response = requests.get(HEALTH_ENDPOINT)
+        response = SESSION.get(HEALTH_ENDPOINT, timeout=HEALTH_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
@@ -59,6 +70,77 @@ def test_health():
         print(f"\nError: {str(e)}")
         assert False, f"Test failed with error: {str(e)}"
 
+def send_query(query):
+    """Send a query to the run-agent endpoint and return (data, elapsed seconds)"""
+    start_time = time.time()
+    response = SESSION.post(
+        AGENT_ENDPOINT, 
+        data=json_body({"request": query}),
+        headers=JSON_HEADERS,
+        timeout=AGENT_TIMEOUT
+    )
+    response.raise_for_status()
+    elapsed = time.time() - start_time
+    # Parse the raw bytes directly rather than decoding them to an intermediate str copy first
+    return json.loads(response.content), elapsed
+
+# Responses reused for repeated queries when --cache is given, keyed by query
+_response_cache = {}
+
+def send_query_batch(queries):
+    """
+    Send all queries to the batch endpoint in one round trip.
+    
+    Returns (list of per-query responses, elapsed seconds), or None if the
+    server has no batch endpoint.
+    """
+    start_time = time.time()
+    response = SESSION.post(
+        BATCH_ENDPOINT,
+        data=json_body({"requests": queries}),
+        headers=JSON_HEADERS,
+        timeout=AGENT_TIMEOUT
+    )
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    elapsed = time.time() - start_time
+    return json.loads(response.content)["responses"], elapsed
+
+def print_query_result(data, elapsed=None):
+    """Display the plan and results of a run-agent response (elapsed is None for cache hits)"""
+    # Display success message
+    if elapsed is None:
+        print("Response served from cache")
+    else:
+        print(f"Response received! ({elapsed:.2f}s)")
+    
+    # Display plan
+    print("\nGenerated Plan:")
+    for i, task in enumerate(data.get("plan", []), 1):
+        print(f"  {i}. {task}")
+    
+    # Display results
+    results = data.get("results", [])
+    if results:
+        print("\nResults:")
+        for result in results:
+            print(f"  Task: {result.get('subtask')}")
+            print(f"  Result: {result.get('result')}")
+            print()
+
+def print_outcome(outcome):
+    """Display a (data, elapsed) response or the exception raised for it; returns the data on success"""
+    if isinstance(outcome, Exception):
+        print(f"Error: {str(outcome)}")
+        return None
+    data, elapsed = outcome
+    if "error" in data:
+        print(f"Error: {data['error']}")
+        return None
+    print_query_result(data, elapsed)
+    return data
+
 def test_agent_query(query=None):
     """Test the run-agent endpoint with a specific query"""
     if query is None:
@@ -70,33 +152,10 @@ def test_agent_query(query=None):
     try:
         # Make the request
         print("Sending request...")
-        start_time = time.time()
-        response = requests.post(
-            AGENT_ENDPOINT, 
-            json={"request": query}
-        )
-        response.raise_for_status()
-        elapsed = time.time() - start_time
+        data, elapsed = send_query(query)
         
         # Process the response
-        data = response.json()
-        
-        # Display success message
-        print(f"Response received! ({elapsed:.2f}s)")
-        
-        # Display plan
-        print("\nGenerated Plan:")
-        for i, task in enumerate(data.get("plan", []), 1):
-            print(f"  {i}. {task}")
-        
-        # Display results
-        results = data.get("results", [])
-        if results:
-            print("\nResults:")
-            for result in results:
-                print(f"  Task: {result.get('subtask')}")
-                print(f"  Result: {result.get('result')}")
-                print()
+        print_query_result(data, elapsed)
         
         # Use assertions for proper pytest behavior
         assert "plan" in data
@@ -109,66 +168,111 @@ def test_agent_query(query=None):
 
 def test_agent_query_parametrized(query=None):
     """Test the run-agent endpoint with a specific query"""
-    if query is None:
-        query = "Write a short blog post about artificial intelligence"
-    
-    print(f"\nTesting Query: \"{query}\"")
-    print("-" * 40)
-    
-    try:
-        # Make the request
-        print("Sending request...")
-        start_time = time.time()
-        response = requests.post(
-            AGENT_ENDPOINT, 
-            json={"request": query}
-        )
-        response.raise_for_status()
-        elapsed = time.time() - start_time
-        
-        # Process the response
-        data = response.json()
-        
-        # Display success message
-        print(f"Response received! ({elapsed:.2f}s)")
-        
-        # Display plan
-        print("\nGenerated Plan:")
-        for i, task in enumerate(data.get("plan", []), 1):
-            print(f"  {i}. {task}")
-        
-        # Display results
-        results = data.get("results", [])
-        if results:
-            print("\nResults:")
-            for result in results:
-                print(f"  Task: {result.get('subtask')}")
-                print(f"  Result: {result.get('result')}")
-                print()
-        
-        # Use assertions for proper pytest behavior
-        assert "plan" in data
-        assert isinstance(data["plan"], list)
-        assert len(data["plan"]) > 0
-        
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        assert False, f"Test failed with error: {str(e)}"
+    test_agent_query(query)
 
-def run_tests():
-    """Run all tests"""
+def print_latency_stats(latencies):
+    """Print median and 95th percentile latency for the successful queries"""
+    if not latencies:
+        return
+    ordered = sorted(latencies)
+    p95 = ordered[max(0, -(-len(ordered) * 95 // 100) - 1)]
+    print(f"\nLatency over {len(ordered)} queries: "
+          f"median {statistics.median(ordered):.2f}s, p95 {p95:.2f}s")
+
+def run_tests(count=1, concurrency=TEST_CONCURRENCY, use_cache=False):
+    """
+    Run all tests, sending the test queries count times with at most concurrency in flight.
+    
+    With use_cache, each distinct query reaches the agent once and its repeats reuse
+    that response; cache hits are reported apart from the latency statistics.
+    """
     print("=" * 50)
     print("AgenticSkeleton API Test")
     print("=" * 50)
     
-    if not test_health():
+    try:
+        test_health()
+    except AssertionError:
         return
     
-    for query in TEST_QUERIES:
-        test_agent_query(query)
+    queries = TEST_QUERIES * count
+    
+    # With use_cache, send only the distinct queries not cached yet, so in-flight
+    # repeats of a query cannot all miss the cache
+    if use_cache:
+        pending = [query for query in dict.fromkeys(queries) if query not in _response_cache]
+    else:
+        pending = queries
+    
+    # Send every query in a single batch request when the server supports it;
+    # repeated runs send queries individually so each latency can be measured
+    outcomes = None
+    if count == 1 and pending:
+        try:
+            batch = send_query_batch(pending)
+        except Exception as e:
+            print(f"Batch request failed: {str(e)}")
+            batch = None
+        if batch is not None:
+            responses, elapsed = batch
+            print(f"\nSent {len(pending)} queries in one batch request")
+            outcomes = [(data, elapsed) for data in responses]
+    
+    latencies = []
+    if outcomes is None:
+        outcomes = []
+        if pending:
+            # Overlap the queries, capped so a local backend is not overwhelmed
+            workers = max(1, min(concurrency, len(pending)))
+            print(f"\nSending {len(pending)} queries, {workers} at a time...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(send_query, query) for query in pending]
+            for future in futures:
+                try:
+                    data, elapsed = future.result()
+                except Exception as e:
+                    outcomes.append(e)
+                else:
+                    outcomes.append((data, elapsed))
+                    latencies.append(elapsed)
+    
+    # Display every query in order; with use_cache only the first occurrence of
+    # a sent query has its own response, later ones are served from the cache
+    sent = iter(outcomes)
+    unanswered = set(pending)
+    cache_hits = 0
+    for query in queries:
+        print(f"\nQuery: \"{query}\"")
+        print("-" * 40)
+        if not use_cache or query in unanswered:
+            unanswered.discard(query)
+            data = print_outcome(next(sent))
+            if use_cache and data is not None:
+                _response_cache[query] = data
+        elif query in _response_cache:
+            cache_hits += 1
+            print_query_result(_response_cache[query])
+        else:
+            print("Error: No response to reuse for this query")
         print("-" * 50)
     
+    print_latency_stats(latencies)
+    if use_cache:
+        print(f"Cache hits (not in latency stats): {cache_hits} of {len(queries)} queries")
+    
     print("\nAll tests completed.")
 
+def main():
+    """Run the test client with command line options"""
+    parser = argparse.ArgumentParser(description='AgenticSkeleton API Test Client')
+    parser.add_argument('--count', '-n', type=int, default=1,
+                        help='Send the test queries this many times and report latency')
+    parser.add_argument('--concurrency', '-c', type=int, default=TEST_CONCURRENCY,
+                        help='Maximum number of queries in flight at once')
+    parser.add_argument('--cache', action='store_true',
+                        help='Send each distinct query once and answer repeats from that response')
+    args = parser.parse_args()
+    run_tests(count=max(1, args.count), concurrency=args.concurrency, use_cache=args.cache)
+
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    main()
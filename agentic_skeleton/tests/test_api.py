@@ -11,11 +11,20 @@ import requests
 import json
 import time
 import os
-import sys
-import textwrap
+import re
 import argparse
 from termcolor import colored
 
+from agentic_skeleton.utils.http_client import (
+    SESSION, JSON_HEADERS, HEALTH_TIMEOUT, AGENT_TIMEOUT, json_body
+)
+
+# Optional C-accelerated serializer for pretty printing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to import from our package
 try:
     from agentic_skeleton.config import settings
@@ -36,40 +45,67 @@ except ImportError:
 HEALTH_ENDPOINT = f"{BASE_URL}/health"
 AGENT_ENDPOINT = f"{BASE_URL}/run-agent"
 
+# Constant separators, table borders and messages rendered once at import
+_BLUE_DASH = colored('-' * 50, 'blue')
+_BOX_TOP = f"┌{'─' * 50}┬{'─' * 50}┐"
+_BOX_HEAD = f"│ {'Subtask':<48} │ {'Result':<48} │"
+_BOX_MID = f"├{'─' * 50}┼{'─' * 50}┤"
+_BOX_BOT = f"└{'─' * 50}┴{'─' * 50}┘"
+_HEALTH_TITLE = colored('🔍 Testing Health Endpoint', 'cyan', attrs=['bold'])
+_QUERY_TITLE = colored('📝 Testing Agent Query', 'cyan', attrs=['bold'])
+_SENDING = colored('Sending request...', 'yellow')
+_CHECK = colored('✓', 'green')
+_ERROR = colored('✗ Error:', 'red')
+_REQUEST_LABEL = colored('Request:', 'blue')
+_RECEIVED = colored('Response received!', 'green')
+_PLAN_TITLE = colored('Generated Plan:', 'green', attrs=['bold'])
+_TABLE_TITLE = colored('📊 Response Summary:', 'green', attrs=['bold'])
+_SUMMARY_TITLE = colored('Summary:', 'blue', attrs=['bold'])
+_TOTAL_LABEL = colored('Total tasks:', 'blue')
+_TIME_LABEL = colored('Response time:', 'blue')
+
+# Every JSON string literal plus the colon that follows it when it is an object key.
+# Consuming values too keeps the scan from restarting inside a string.
+_JSON_KEY_RE = re.compile(r'("(?:[^"\\]|\\.)*")(\s*:)?')
+
+# Color codes around a key, taken from termcolor once (empty when color is disabled)
+_KEY_COLOR_START, _KEY_COLOR_END = colored('\0', 'yellow').split('\0')
+
+def _color_key(match):
+    """Wrap a matched JSON key in the key color, leaving string values unchanged"""
+    if match.group(2) is None:
+        return match.group(0)
+    return f"{_KEY_COLOR_START}{match.group(1)}{_KEY_COLOR_END}{match.group(2)}"
+
+def _dumps_indented(data, indent):
+    """Serialize data as indented JSON, using orjson when it is installed and can handle the data"""
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # e.g. non-string keys, which only the stdlib encoder accepts
+            pass
+    return json.dumps(data, indent=indent)
+
 def pretty_print_json(data, title=None, indent=2):
     """Pretty print a JSON response with colored keys"""
     if title:
         print(f"\n{colored(title, 'blue', attrs=['bold'])}")
     
-    json_str = json.dumps(data, indent=indent)
-    # Add color to keys
-    colored_json = ""
-    in_quotes = False
-    in_key = False
-    
-    for i, char in enumerate(json_str):
-        if char == '"':
-            in_quotes = not in_quotes
-            if in_quotes and i + 1 < len(json_str) and json_str[i+1] == ":":
-                in_key = True
-            elif not in_quotes and in_key:
-                in_key = False
-        
-        if in_key:
-            colored_json += colored(char, 'yellow')
-        else:
-            colored_json += char
+    json_str = _dumps_indented(data, indent)
+    # Add color to keys: one regex pass wraps each whole key in a single color pair
+    colored_json = _JSON_KEY_RE.sub(_color_key, json_str)
             
     for line in colored_json.split('\n'):
         print(f"  {line}")
 
 def test_health():
     """Test the health check endpoint"""
-    print(f"\n{colored('🔍 Testing Health Endpoint', 'cyan', attrs=['bold'])}")
-    print(f"{colored('-' * 50, 'blue')}")
+    print(f"\n{_HEALTH_TITLE}")
+    print(_BLUE_DASH)
     
     try:
-        response = requests.get(HEALTH_ENDPOINT)
+        response = SESSION.get(HEALTH_ENDPOINT, timeout=HEALTH_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
@@ -78,7 +114,7 @@ def test_health():
         pretty_print_json(data, "Health Endpoint Response:")
         
         mode = colored(data.get('mode', 'unknown'), 'cyan')
-        print(f"\n{colored('✓', 'green')} Server is {colored('running', 'green')} in {mode} mode")
+        print(f"\n{_CHECK} Server is {colored('running', 'green')} in {mode} mode")
         
         # Use assertions for proper pytest behavior
         assert response.status_code == 200
@@ -90,45 +126,48 @@ def test_health():
         assert False, "Server is not running"
         
     except Exception as e:
-        print(f"\n{colored('✗ Error:', 'red')} {str(e)}")
+        print(f"\n{_ERROR} {str(e)}")
         assert False, f"Test failed with error: {str(e)}"
 
 def test_agent_query(query="Tell me about Python programming language"):
     """Test the run-agent endpoint with a specific query"""
-    print(f"\n{colored('📝 Testing Agent Query', 'cyan', attrs=['bold'])}")
-    print(f"{colored('-' * 50, 'blue')}")
-    print(f"{colored('Request:', 'blue')} \"{query}\"")
+    print(f"\n{_QUERY_TITLE}")
+    print(_BLUE_DASH)
+    print(f"{_REQUEST_LABEL} \"{query}\"")
     
     try:
         # Make the request
-        print(f"\n{colored('Sending request...', 'yellow')}")
+        print(f"\n{_SENDING}")
         start_time = time.time()
-        response = requests.post(
+        response = SESSION.post(
             AGENT_ENDPOINT, 
-            json={"request": query}
+            data=json_body({"request": query}),
+            headers=JSON_HEADERS,
+            timeout=AGENT_TIMEOUT
         )
         response.raise_for_status()
         end_time = time.time()
         elapsed = end_time - start_time
         
-        # Process the response
-        data = response.json()
+        # Process the response; parse the raw bytes directly rather than
+        # decoding them to an intermediate str copy first
+        data = json.loads(response.content)
         
         # Display success message with timing
-        print(f"{colored('✓', 'green')} {colored('Response received!', 'green')} ({elapsed:.2f}s)")
+        print(f"{_CHECK} {_RECEIVED} ({elapsed:.2f}s)")
         
         # Display plan
-        print(f"\n{colored('Generated Plan:', 'green', attrs=['bold'])}")
+        print(f"\n{_PLAN_TITLE}")
         for i, task in enumerate(data.get("plan", []), 1):
             print(f"  {i}. {task}")
         
         # Display results in a table format
         results = data.get("results", [])
         if results:
-            print(f"\n{colored('📊 Response Summary:', 'green', attrs=['bold'])}")
-            print(f"┌{'─' * 50}┬{'─' * 50}┐")
-            print(f"│ {'Subtask':<48} │ {'Result':<48} │")
-            print(f"├{'─' * 50}┼{'─' * 50}┤")
+            print(f"\n{_TABLE_TITLE}")
+            print(_BOX_TOP)
+            print(_BOX_HEAD)
+            print(_BOX_MID)
             
             for result in results:
                 # Truncate and format subtask and result for table display
@@ -145,12 +184,12 @@ def test_agent_query(query="Tell me about Python programming language"):
                 
                 print(f"│ {subtask:<48} │ {result_text:<48} │")
             
-            print(f"└{'─' * 50}┴{'─' * 50}┘")
+            print(_BOX_BOT)
         
         # Print summary
-        print(f"\n{colored('Summary:', 'blue', attrs=['bold'])}")
-        print(f"  {colored('Total tasks:', 'blue')} {len(data.get('plan', []))}")
-        print(f"  {colored('Response time:', 'blue')} {elapsed:.2f} seconds")
+        print(f"\n{_SUMMARY_TITLE}")
+        print(f"  {_TOTAL_LABEL} {len(data.get('plan', []))}")
+        print(f"  {_TIME_LABEL} {elapsed:.2f} seconds")
         
         # Use assertions for proper pytest behavior
         assert response.status_code == 200
@@ -159,7 +198,7 @@ def test_agent_query(query="Tell me about Python programming language"):
         assert len(data["plan"]) > 0
         
     except Exception as e:
-        print(f"{colored('✗ Error:', 'red')} {str(e)}")
+        print(f"{_ERROR} {str(e)}")
         assert False, f"Test failed with error: {str(e)}"
 
 def run_unit_tests():
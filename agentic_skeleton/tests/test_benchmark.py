@@ -0,0 +1,69 @@
+"""
+Benchmark Tests
+==============
+
+Performance benchmarks for the per-request hot paths of the AgenticSkeleton API.
+Requires the optional pytest-benchmark plugin; the module is skipped without it.
+
+Run with:
+    pytest agentic_skeleton/tests/test_benchmark.py --benchmark-sort=min
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from agentic_skeleton.api.endpoints import app
+from agentic_skeleton.core.mock.classifier import classify_request
+from agentic_skeleton.core.mock.generator import get_mock_task_response
+from agentic_skeleton.core.mock_core import generate_mock_plan_and_results
+
+# Representative requests covering each plan type
+TEST_CASES = [
+    ("Write a blog post about AI", "write"),
+    ("Analyze market trends in renewable energy", "analyze"),
+    ("Develop a Python API for data processing", "develop"),
+    ("Design a user interface for a mobile app", "design"),
+    ("Train a machine learning model for NLP", "data-science")
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_mode():
+    """Run every benchmark in mock mode with logging silenced"""
+    logging.disable(logging.CRITICAL)
+    with patch('agentic_skeleton.config.settings.is_using_mock', return_value=True):
+        yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.mark.parametrize("user_request,expected_type", TEST_CASES)
+def test_bench_classify_request(benchmark, user_request, expected_type):
+    """Benchmark request classification"""
+    result = benchmark(classify_request, user_request)
+    assert result == expected_type
+
+
+@pytest.mark.parametrize("user_request,expected_type", TEST_CASES)
+def test_bench_mock_task_response(benchmark, user_request, expected_type):
+    """Benchmark mock response generation for a single task"""
+    result = benchmark(get_mock_task_response, user_request)
+    assert "[MOCK]" in result
+
+
+@pytest.mark.parametrize("user_request,expected_type", TEST_CASES)
+def test_bench_mock_plan_and_results(benchmark, user_request, expected_type):
+    """Benchmark full mock plan generation and execution"""
+    subtasks, results = benchmark(generate_mock_plan_and_results, user_request)
+    assert len(subtasks) == len(results)
+
+
+@pytest.mark.parametrize("user_request,expected_type", TEST_CASES)
+def test_bench_run_agent_endpoint(benchmark, user_request, expected_type):
+    """Benchmark the /run-agent endpoint end to end"""
+    client = app.test_client()
+    response = benchmark(client.post, '/run-agent', json={"request": user_request})
+    assert response.status_code == 200
@@ -14,7 +14,10 @@ import sys
 import time
 from unittest.mock import patch, MagicMock
 
+from flask import jsonify
+
 # Import necessary modules from our package
+from agentic_skeleton.api import endpoints
 from agentic_skeleton.api.endpoints import app
 from agentic_skeleton.config import settings
 from agentic_skeleton.utils.helpers import colored, format_terminal_header
@@ -170,6 +173,48 @@ class TestAgenticSkeletonIntegration(unittest.TestCase):
             # Add a small delay to prevent overwhelming the system
             time.sleep(0.5)
     
+    @unittest.skipIf(endpoints.orjson is None, "orjson is not installed")
+    def test_responses_are_serialized_with_orjson(self):
+        """Test that jsonify responses go through orjson and match the default encoder"""
+        data = {"plan": ["Research", "Write"], "results": [{"subtask": "Research", "result": "Notes"}]}
+        
+        with patch.object(endpoints.orjson, 'dumps', wraps=endpoints.orjson.dumps) as mock_dumps:
+            with app.app_context():
+                body = jsonify(data).get_data(as_text=True)
+        
+        mock_dumps.assert_called_once()
+        self.assertEqual(body, json.dumps(data, separators=(",", ":"), sort_keys=True) + "\n")
+        
+        # Non-ASCII text keeps Flask's escaped output
+        with app.app_context():
+            self.assertEqual(app.json.dumps({"text": "café"}), '{"text": "caf\\u00e9"}')
+    
+    def test_batch_workflow(self):
+        """Test processing several requests in one batch call"""
+        print(f"\n{colored('Testing batch workflow', 'blue')}")
+        
+        test_requests = [
+            "Write a short story about time travel",
+            "Develop a Python script for data cleaning"
+        ]
+        
+        response = self.app.post('/run-agent-batch', json={"requests": test_requests})
+        self.assertEqual(response.status_code, 200)
+        
+        # One plan/results entry per request, in order
+        data = json.loads(response.data)
+        self.assertEqual(len(data['responses']), len(test_requests))
+        for entry in data['responses']:
+            self.assertIn('plan', entry)
+            self.assertIn('results', entry)
+            self.assertEqual(len(entry['plan']), len(entry['results']))
+        
+        # Invalid payloads are rejected
+        bad_response = self.app.post('/run-agent-batch', json={"requests": "not a list"})
+        self.assertEqual(bad_response.status_code, 400)
+        
+        print(f"{colored('✅ Batch workflow verified', 'green')}")
+    
     def test_error_recovery(self):
         """Test the system's ability to recover from errors"""
         print(f"\n{colored('Testing error recovery capabilities', 'blue')}")
@@ -14,7 +14,7 @@ import logging
 import random
 import re
 import subprocess
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 
 # Try to import termcolor for colored terminal output
 try:
@@ -99,6 +99,9 @@ def setup_logging():
 
 
 
+# Numbered list item such as "1. Task" or "2) Task", capturing the task text
+_NUMBERED_ITEM_RE = re.compile(r'^\d+[\.\)]\s*(.*)', re.DOTALL)
+
 def extract_subtasks_from_text(text: str) -> List[str]:
     """
     Extract numbered subtasks from text generated by a language model.
@@ -109,22 +112,60 @@ def extract_subtasks_from_text(text: str) -> List[str]:
     Returns:
         List of extracted subtasks
     """
-    # Extract numbered list items from the text
+    # Extract numbered list items from the text. A single multiline findall over
+    # the whole text was measured slower than this per-line match: str.splitlines
+    # splits on more separators than re.M's "^"/"$", and emulating them needs
+    # lookarounds at every position
     subtasks = []
     lines = text.splitlines()
     
     for line in lines:
-        line = line.strip()
-        # Match lines that start with a number followed by period or parenthesis
-        if re.match(r'^\d+[\.\)]', line):
-            # Extract the text after the number and delimiter
-            task_text = re.sub(r'^\d+[\.\)]\s*', '', line).strip()
-            if task_text:
-                subtasks.append(task_text)
+        task_text = _parse_subtask_line(line)
+        if task_text:
+            subtasks.append(task_text)
     
     return subtasks
 
 
+def iter_subtasks_from_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Yield numbered subtasks from streamed text as soon as each line is complete.
+    
+    Produces the same subtasks as extract_subtasks_from_text on the joined text.
+    
+    Args:
+        chunks: Text fragments in arrival order, split at arbitrary points
+        
+    Yields:
+        Each extracted subtask
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        lines = buffer.splitlines(keepends=True)
+        # Hold back a trailing partial line until more text arrives
+        buffer = lines.pop() if lines and lines[-1].splitlines() == [lines[-1]] else ""
+        for line in lines:
+            task_text = _parse_subtask_line(line)
+            if task_text:
+                yield task_text
+    
+    # The last line has no trailing newline
+    task_text = _parse_subtask_line(buffer)
+    if task_text:
+        yield task_text
+
+
+def _parse_subtask_line(line: str) -> Optional[str]:
+    """Return the task text of a numbered list line, or None for any other line"""
+    # Match lines that start with a number followed by period or parenthesis,
+    # capturing the text after the number and delimiter in the same pass
+    match = _NUMBERED_ITEM_RE.match(line.strip())
+    if match:
+        return match.group(1).strip() or None
+    return None
+
+
 
 
 
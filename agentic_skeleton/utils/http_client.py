@@ -0,0 +1,61 @@
+"""
+HTTP Test Client
+================
+
+Shared HTTP setup for the scripts that exercise the running API:
+- Request timeouts and retry policy
+- A pooled keep-alive session
+- Request body serialization
+"""
+
+import atexit
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional faster serializer for request bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Request timeouts in seconds as (connect, read): a missing server fails fast,
+# while agent queries may still wait on LLM calls
+CONNECT_TIMEOUT = 5
+HEALTH_TIMEOUT = (CONNECT_TIMEOUT, 5)
+AGENT_TIMEOUT = (CONNECT_TIMEOUT, 60)
+
+# Retry transient failures (server still starting, gateway errors) with exponential
+# backoff; 4xx responses are not retried. Read errors are never retried: a read
+# timeout means the server may still be running the agent, and re-sending the
+# POST would start the same work again.
+RETRY_OPTIONS = dict(
+    total=3,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    raise_on_status=False
+)
+try:
+    RETRY = Retry(backoff_jitter=0.5, **RETRY_OPTIONS)
+except TypeError:
+    # urllib3 < 2 has no jitter support
+    RETRY = Retry(**RETRY_OPTIONS)
+
+# Shared session so every call reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=RETRY))
+atexit.register(SESSION.close)
+
+# Header for request bodies that are serialized up front
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def json_body(payload) -> bytes:
+    """Serialize a request payload straight to bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()